@@ -1,35 +1,59 @@
 from flask import Flask, request
 from flask_cors import CORS
-from app.extensions import db, migrate, jwt
+from app.extensions import db, migrate, jwt, cache, limiter, events
 from app.config import Config
 
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
 
+    from app.json_provider import init_json_provider
+    init_json_provider(app)
+
+    from app.logs import init_logging
+    init_logging(app)
+
     # Configure CORS
     CORS(app,
          resources={
              r"/*": {
                  "origins": ["http://localhost:3000"],
                  "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-                 "allow_headers": ["Content-Type", "Authorization", "Accept"],
+                 "allow_headers": ["Content-Type", "Authorization", "Accept", "Idempotency-Key", "Last-Event-ID"],
                  "supports_credentials": True,
-                 "expose_headers": ["Content-Type", "Authorization"],
+                 "expose_headers": ["Content-Type", "Authorization", "ETag", "Idempotent-Replayed", "X-Request-ID"],
                  "max_age": 600  # Cache preflight requests for 10 minutes
              }
          })
 
 
     # Initialize extensions
+    from app.database import configure_database, init_sqlite_pragmas
+    configure_database(app)
     db.init_app(app)
+    init_sqlite_pragmas(app)
+
+    from app.instrumentation import init_instrumentation
+    init_instrumentation(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
+    cache.init_app(app)
+    events.init_app(app)
+    limiter.init_app(app)
+
+    from app.services.password_hasher import password_hasher
+    password_hasher.init_app(app)
+
+    from app.utils.auth import init_jwt_callbacks
+    init_jwt_callbacks(app, jwt)
 
     # Import models
     from app.models.user import User
     from app.models.review import Review
     from app.models.quote import Quote
+    from app.models.outbound_email import OutboundEmail
+    from app.models.review_stats import ReviewStats
+    from app.models.idempotency_record import IdempotencyRecord
 
     # Register CLI commands
     from app.cli import init_cli
@@ -45,6 +69,22 @@ def create_app():
     app.register_blueprint(quote_routes, url_prefix='/api/quotes')
 
 
+    # Optionally drain the email outbox from a thread in this process.
+    # In production run `flask email-worker` as a separate process instead.
+    if app.config['EMAIL_WORKER_IN_PROCESS']:
+        from app.services.email_queue import EmailWorker
+        app.extensions['email_worker'] = EmailWorker(app).start()
+
+    # Maintenance jobs are always registered so `flask worker` can run them;
+    # they only run in this process when SCHEDULER_IN_PROCESS is set
+    from app.services.maintenance import register_maintenance_jobs
+    from app.services.scheduler import JobScheduler
+    scheduler = JobScheduler(app)
+    register_maintenance_jobs(scheduler, app.config)
+    app.extensions['scheduler'] = scheduler
+    if app.config['SCHEDULER_IN_PROCESS']:
+        scheduler.start()
+
     # Add CORS preflight handler
     @app.before_request
     def handle_preflight():
@@ -1,3 +1,5 @@
+import contextlib
+import signal
 import click
 from flask.cli import with_appcontext
 from app.extensions import db
@@ -27,3 +29,174 @@ def init_cli(app):
         except Exception as e:
             click.echo(f"Error creating superuser: {str(e)}")
             db.session.rollback()
+
+    @app.cli.command("revoke-tokens")
+    @click.argument("username")
+    def revoke_tokens(username):
+        """Invalidate every access token issued to a user"""
+        from app.services.user_cache import user_cache
+
+        try:
+            user = User.query.filter_by(username=username).first()
+            if not user:
+                click.echo(f"User {username} not found!")
+                return
+
+            user.token_version = (user.token_version or 0) + 1
+            db.session.commit()
+            user_cache.invalidate(user.id)
+
+            click.echo(f"Tokens revoked for {username}")
+        except Exception as e:
+            click.echo(f"Error revoking tokens: {str(e)}")
+            db.session.rollback()
+
+    @app.cli.group("quotes")
+    def quotes():
+        """Bulk import/export of quote requests"""
+
+    def detect_format(path, fmt):
+        if fmt:
+            return fmt
+        return 'csv' if path.lower().endswith('.csv') else 'ndjson'
+
+    def open_stream(path, mode):
+        """Open PATH as text (newline='' for the csv module), '-' meaning stdin/stdout"""
+        if path == '-':
+            stream = click.get_text_stream('stdin' if mode == 'r' else 'stdout', encoding='utf-8')
+            return contextlib.nullcontext(stream)
+        return open(path, mode, encoding='utf-8', newline='')
+
+    @quotes.command("export")
+    @click.argument("path", default="-")
+    @click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]), help="Defaults to the file extension, else ndjson")
+    @click.option("--status", help="Only export quotes with this status")
+    @click.option("--batch-size", default=2000, show_default=True, help="Rows fetched per database round trip")
+    def export_quotes(path, fmt, status, batch_size):
+        """Stream quotes to PATH (or stdout) as CSV or NDJSON"""
+        from app.services.quote_transfer import iter_csv, iter_ndjson, iter_quote_rows
+
+        fmt = detect_format(path, fmt)
+        rows = iter_quote_rows(batch_size=batch_size, status=status)
+        chunks = iter_csv(rows) if fmt == 'csv' else iter_ndjson(rows)
+
+        with open_stream(path, 'w') as out:
+            for chunk in chunks:
+                out.write(chunk)
+
+        if path != '-':
+            click.echo(f"Exported quotes to {path}", err=True)
+
+    @quotes.command("import")
+    @click.argument("path", default="-")
+    @click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]), help="Defaults to the file extension, else ndjson")
+    @click.option("--batch-size", default=2000, show_default=True, help="Rows inserted per transaction")
+    @click.option("--keep-ids", is_flag=True, help="Insert the id column from the file instead of assigning new ids")
+    @click.option("--strict", is_flag=True, help="Abort on the first invalid row instead of skipping it")
+    def import_quotes(path, fmt, batch_size, keep_ids, strict):
+        """Stream quotes from PATH (or stdin) in CSV or NDJSON format"""
+        from app.extensions import cache
+        from app.services.quote_transfer import QuoteImportError, import_quotes as run_import, read_csv, read_ndjson
+
+        fmt = detect_format(path, fmt)
+        try:
+            with open_stream(path, 'r') as source:
+                records = read_csv(source) if fmt == 'csv' else read_ndjson(source)
+                imported, skipped = run_import(
+                    records,
+                    batch_size=batch_size,
+                    keep_ids=keep_ids,
+                    strict=strict,
+                    on_error=lambda e: click.echo(f"Skipping {e}", err=True)
+                )
+        except QuoteImportError as e:
+            db.session.rollback()
+            click.echo(f"Import aborted at {e}", err=True)
+            raise SystemExit(1)
+        except Exception as e:
+            db.session.rollback()
+            click.echo(f"Error importing quotes: {str(e)}", err=True)
+            raise SystemExit(1)
+        finally:
+            cache.invalidate('quotes')
+
+        click.echo(f"Imported {imported} quote(s), skipped {skipped}", err=True)
+
+    @app.cli.command("rebuild-review-stats")
+    def rebuild_review_stats():
+        """Recompute the review aggregate from the reviews table"""
+        from app.services.review_stats_service import ReviewStatsService
+
+        try:
+            stats = ReviewStatsService.rebuild()
+            db.session.commit()
+            click.echo(f"Review stats rebuilt: {stats.review_count} review(s)")
+        except Exception as e:
+            click.echo(f"Error rebuilding review stats: {str(e)}")
+            db.session.rollback()
+
+    @app.cli.command("email-worker")
+    @click.option("--once", is_flag=True, help="Drain the outbox once and exit")
+    def email_worker(once):
+        """Deliver queued emails from the outbox"""
+        from app.services.email_queue import EmailWorker
+
+        worker = EmailWorker(app)
+        if once:
+            total = 0
+            while True:
+                processed = worker.run_once()
+                if not processed:
+                    break
+                total += processed
+            worker.stop()
+            click.echo(f"Processed {total} queued email(s)")
+            return
+
+        click.echo("Email worker started, press Ctrl+C to stop")
+        # Treat SIGTERM (process managers, containers) like Ctrl+C
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            worker.run_forever()
+        except KeyboardInterrupt:
+            click.echo("Stopping email worker...")
+        finally:
+            worker.stop(drain_timeout=app.config['SHUTDOWN_EMAIL_DRAIN_TIMEOUT'])
+
+    @app.cli.command("worker")
+    @click.option("--once", is_flag=True, help="Run every enabled job once and exit")
+    @click.option("--job", "job_name", help="Run a single job now and exit")
+    @click.option("--no-email", is_flag=True, help="Do not also drain the email outbox")
+    def worker(once, job_name, no_email):
+        """Run scheduled maintenance jobs (and the email outbox) off the request path"""
+        scheduler = app.extensions['scheduler']
+
+        if job_name:
+            if job_name not in scheduler.jobs:
+                raise click.BadParameter(f"choose from: {', '.join(scheduler.jobs)}", param_hint="--job")
+            ok = scheduler.run_job(job_name)
+            click.echo(f"Job {job_name} {'succeeded' if ok else 'failed'}")
+            raise SystemExit(0 if ok else 1)
+
+        if once:
+            failed = scheduler.run_all()
+            click.echo(f"Jobs failed: {', '.join(failed)}" if failed else "All jobs succeeded")
+            raise SystemExit(1 if failed else 0)
+
+        email_worker = None
+        if not no_email:
+            from app.services.email_queue import EmailWorker
+            email_worker = EmailWorker(app).start()
+
+        intervals = ', '.join(f"{name} every {job.interval:g}s" for name, job in scheduler.jobs.items()
+                              if job.interval > 0)
+        click.echo(f"Worker started ({intervals}), press Ctrl+C to stop")
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            click.echo("Stopping worker...")
+        finally:
+            scheduler.stop()
+            if email_worker is not None:
+                email_worker.stop(drain_timeout=app.config['SHUTDOWN_EMAIL_DRAIN_TIMEOUT'])
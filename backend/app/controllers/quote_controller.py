@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify
-from app.models import Quote, db
-from app.services.email_service import EmailService
+from app.models import db
+from app.services.quote_service import QuoteService
+from app.utils.pagination import PaginationError, parse_limit
+from app.utils.validators import ValidationError
 
 
 quote_bp = Blueprint('quote', __name__)
@@ -8,51 +10,19 @@ quote_bp = Blueprint('quote', __name__)
 @quote_bp.route('/api/quotes', methods=['POST'])
 def create_quote():
     try:
-        data = request.get_json()
+        quote, replayed = QuoteService.create(request.get_json(silent=True),
+                                              idempotency_key=request.headers.get('Idempotency-Key'))
 
-        # Validate required fields
-        required_fields = ['name', 'email', 'phone', 'service_type',
-                         'project_details', 'preferred_contact_method']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
-
-        # Create new quote
-        new_quote = Quote(
-            name=data['name'],
-            email=data['email'],
-            phone=data['phone'],
-            service_type=data['service_type'],
-            project_details=data['project_details'],
-            preferred_contact_method=data['preferred_contact_method'],
-            budget_range=data.get('budget_range'),
-            timeline=data.get('timeline')
-        )
-
-        db.session.add(new_quote)
-        db.session.commit()
-
-        # Send email notification
-        email_body = f"""
-        New Quote Request:
-
-        Name: {new_quote.name}
-        Email: {new_quote.email}
-        Phone: {new_quote.phone}
-        Service Type: {new_quote.service_type}
-        Project Details: {new_quote.project_details}
-        Preferred Contact: {new_quote.preferred_contact_method}
-        Budget Range: {new_quote.budget_range or 'Not specified'}
-        Timeline: {new_quote.timeline or 'Not specified'}
-        """
-
-        EmailService.send_email('New Quote Request', email_body)
-
-        return jsonify({
+        response = jsonify({
             'message': 'Quote request submitted successfully',
-            'data': new_quote.to_dict()
-        }), 201
-
+            'data': quote
+        })
+        if replayed:
+            response.headers['Idempotent-Replayed'] = 'true'
+        return response, 201
+
+    except ValidationError as e:
+        return jsonify({'error': e.message}), e.status_code
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
@@ -60,11 +30,15 @@ def create_quote():
 @quote_bp.route('/api/quotes', methods=['GET'])
 def get_quotes():
     try:
-        quotes = Quote.query.order_by(Quote.created_at.desc()).all()
+        rows, next_cursor = QuoteService.list_page(parse_limit(request.args.get('limit')),
+                                                   cursor=request.args.get('cursor'))
         return jsonify({
             'message': 'Quotes retrieved successfully',
-            'data': [quote.to_dict() for quote in quotes]
+            'data': QuoteService.serialize(rows),
+            'next_cursor': next_cursor
         }), 200
 
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
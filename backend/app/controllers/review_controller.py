@@ -1,6 +1,9 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.models import Review, User, db
+from app.models import db
+from app.services.review_service import ReviewService
+from app.utils.pagination import PaginationError, parse_limit
+from app.utils.validators import ValidationError
 
 review_bp = Blueprint('review', __name__)
 
@@ -8,35 +11,15 @@ review_bp = Blueprint('review', __name__)
 @jwt_required()
 def create_review():
     try:
-        current_user_id = get_jwt_identity()
-        data = request.get_json()
-
-        # Validate required fields
-        required_fields = ['title', 'content', 'rating']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
-
-        # Validate rating is between 1 and 5
-        if not 1 <= data['rating'] <= 5:
-            return jsonify({'error': 'Rating must be between 1 and 5'}), 400
-
-        # Create new review
-        new_review = Review(
-            title=data['title'],
-            content=data['content'],
-            rating=data['rating'],
-            user_id=current_user_id
-        )
-
-        db.session.add(new_review)
-        db.session.commit()
+        review = ReviewService.create(get_jwt_identity(), request.get_json(silent=True))
 
         return jsonify({
             'message': 'Review created successfully',
-            'data': new_review.to_dict()
+            'data': review.to_dict()
         }), 201
 
+    except ValidationError as e:
+        return jsonify({'error': e.message}), e.status_code
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
@@ -44,11 +27,18 @@ def create_review():
 @review_bp.route('/api/reviews', methods=['GET'])
 def get_reviews():
     try:
-        reviews = Review.query.order_by(Review.created_at.desc()).all()
+        rows, next_cursor = ReviewService.list_page(
+            parse_limit(request.args.get('limit'), default=20, maximum=100),
+            cursor=request.args.get('cursor'),
+            sort=request.args.get('sort', 'newest')
+        )
         return jsonify({
             'message': 'Reviews retrieved successfully',
-            'data': [review.to_dict() for review in reviews]
+            'data': ReviewService.serialize(rows),
+            'next_cursor': next_cursor
         }), 200
 
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
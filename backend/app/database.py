@@ -0,0 +1,67 @@
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from app.extensions import db
+
+
+def normalize_database_url(url):
+    """Accept the legacy postgres:// scheme some hosting providers hand out"""
+    if url.startswith('postgres://'):
+        return 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
+def engine_options(config):
+    """Engine options tuned for the configured backend"""
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+
+    if url.get_backend_name() == 'sqlite':
+        if url.database in (None, '', ':memory:'):
+            return {}
+        return {
+            # pysqlite's own lock wait, matching PRAGMA busy_timeout
+            'connect_args': {'timeout': config['SQLITE_BUSY_TIMEOUT_MS'] / 1000}
+        }
+
+    return {
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        'pool_pre_ping': True
+    }
+
+
+def configure_database(app):
+    """Fill in engine options before db.init_app; explicit settings win"""
+    app.config['SQLALCHEMY_DATABASE_URI'] = normalize_database_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    options = engine_options(app.config)
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+def init_sqlite_pragmas(app):
+    """Apply WAL and friends to every new SQLite connection.
+
+    WAL lets readers proceed while a writer holds the lock, and busy_timeout
+    makes concurrent writers from several workers wait instead of failing with
+    'database is locked'.
+    """
+    config = app.config
+    pragmas = [
+        f"PRAGMA journal_mode={config['SQLITE_JOURNAL_MODE']}",
+        f"PRAGMA synchronous={config['SQLITE_SYNCHRONOUS']}",
+        f"PRAGMA busy_timeout={int(config['SQLITE_BUSY_TIMEOUT_MS'])}",
+        f"PRAGMA mmap_size={int(config['SQLITE_MMAP_SIZE'])}",
+    ]
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', set_pragmas)
@@ -1,19 +1,57 @@
+import math
 from functools import wraps
-from flask import jsonify
-from flask_jwt_extended import get_jwt_identity
-from app.models.user import User
+from flask import current_app, jsonify, request
+from app.extensions import limiter
+from app.utils.auth import current_user_is_admin
 
 def admin_required():
     """Decorator to check if the current user has admin privileges"""
     def wrapper(fn):
         @wraps(fn)
         def decorated_function(*args, **kwargs):
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
-
-            if not user or not user.is_admin:
+            # The admin flag travels in the JWT, so no database lookup is needed
+            if not current_user_is_admin():
                 return jsonify({'error': 'Admin privileges required'}), 403
 
             return fn(*args, **kwargs)
         return decorated_function
     return wrapper
+
+def client_ip():
+    """Rate limit key: the caller's IP (first X-Forwarded-For hop when behind a trusted proxy)"""
+    if current_app.config['RATE_LIMIT_TRUST_FORWARDED_FOR'] and request.access_route:
+        return request.access_route[0]
+    return request.remote_addr or 'unknown'
+
+def json_field(field):
+    """Rate limit key: a normalized field of the JSON body, e.g. the email being logged into"""
+    def key_func():
+        data = request.get_json(silent=True)
+        value = data.get(field) if isinstance(data, dict) else None
+        return str(value).strip().lower() if value else None
+    return key_func
+
+def rate_limit(limit_config_key, key_func=client_ip):
+    """Decorator applying a token bucket before the view does any work.
+
+    `limit_config_key` names a config value such as '10/minute'. Requests for
+    which `key_func` returns None are not counted against this limit.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorated_function(*args, **kwargs):
+            if request.method != 'OPTIONS':
+                key = key_func()
+                if key is not None:
+                    allowed, retry_after = limiter.hit(key, limit_config_key)
+                    if not allowed:
+                        response = jsonify({
+                            'success': False,
+                            'error': 'Too many requests, please try again later'
+                        })
+                        response.headers['Retry-After'] = str(max(math.ceil(retry_after), 1))
+                        return response, 429
+
+            return fn(*args, **kwargs)
+        return decorated_function
+    return wrapper
@@ -1,7 +1,13 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
+from app.utils.cache import ResponseCache
+from app.utils.events import EventBroker
+from app.utils.rate_limit import RateLimiter
 
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
+cache = ResponseCache()
+events = EventBroker()
+limiter = RateLimiter()
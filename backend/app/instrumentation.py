@@ -0,0 +1,201 @@
+import threading
+import time
+from flask import Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+from app.extensions import db
+
+# Upper bounds in seconds, Prometheus style (+Inf is implicit)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Process-local counters and histograms rendered in Prometheus text format.
+
+    Each worker process keeps its own registry, so scrape every worker (or
+    run a single process per container) to get complete numbers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}  # name -> {labels tuple: Histogram}
+        self._counters = {}    # name -> {labels tuple: value}
+        self._help = {}
+        self._buckets = {}
+
+    def describe(self, name, help_text, buckets=None):
+        self._help[name] = help_text
+        if buckets is not None:
+            self._buckets[name] = buckets
+
+    def observe(self, name, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._buckets.get(name, LATENCY_BUCKETS))
+            histogram.observe(value)
+
+    def increment(self, name, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    @staticmethod
+    def _labels(pairs):
+        if not pairs:
+            return ''
+        escaped = []
+        for key, value in pairs:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            escaped.append(f'{key}="{value}"')
+        return '{' + ','.join(escaped) + '}'
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                if name in self._help:
+                    lines.append(f'# HELP {name} {self._help[name]}')
+                lines.append(f'# TYPE {name} counter')
+                for labels, value in sorted(series.items()):
+                    lines.append(f'{name}{self._labels(labels)} {value}')
+
+            for name, series in sorted(self._histograms.items()):
+                if name in self._help:
+                    lines.append(f'# HELP {name} {self._help[name]}')
+                lines.append(f'# TYPE {name} histogram')
+                for labels, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{self._labels(labels + (("le", bound),))} {cumulative}')
+                    lines.append(f'{name}_bucket{self._labels(labels + (("le", "+Inf"),))} {histogram.count}')
+                    lines.append(f'{name}_sum{self._labels(labels)} {histogram.total}')
+                    lines.append(f'{name}_count{self._labels(labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
+metrics.describe('http_request_duration_seconds', 'Wall time spent handling a request')
+metrics.describe('http_requests_total', 'Requests handled, by route and status')
+metrics.describe('db_query_duration_seconds', 'Duration of individual SQL statements')
+metrics.describe('db_queries_per_request', 'SQL statements executed per request', COUNT_BUCKETS)
+metrics.describe('smtp_send_duration_seconds', 'Time spent delivering one email over SMTP')
+
+_enabled = False
+
+
+def record_timing(name, seconds):
+    """Attribute time to a subsystem ('smtp', 'hash', ...) for the current request.
+
+    Safe to call from anywhere, including background threads; it is a no-op
+    when instrumentation is off.
+    """
+    if not _enabled:
+        return
+    if name == 'smtp':
+        metrics.observe('smtp_send_duration_seconds', seconds)
+    if has_request_context() and 'request_timings' in g:
+        timing = g.request_timings.setdefault(name, [0, 0.0])
+        timing[0] += 1
+        timing[1] += seconds
+
+
+class timed:
+    """Context manager form of record_timing"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record_timing(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def _install_sql_listeners(engine):
+    # The start time lives on the per-statement execution context, so a
+    # statement that raises (and never reaches after_cursor_execute) leaves
+    # nothing behind on the pooled connection
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+        metrics.observe('db_query_duration_seconds', elapsed)
+        if has_request_context() and 'request_timings' in g:
+            timing = g.request_timings.setdefault('db', [0, 0.0])
+            timing[0] += 1
+            timing[1] += elapsed
+
+
+def _server_timing(total, timings):
+    parts = [f'app;dur={total * 1000:.2f}']
+    for name, (count, seconds) in timings.items():
+        parts.append(f'{name};dur={seconds * 1000:.2f};desc="{count} call(s)"')
+    return ', '.join(parts)
+
+
+def init_instrumentation(app):
+    """Opt-in (INSTRUMENTATION_ENABLED=true) request, SQL and SMTP timing"""
+    global _enabled
+    if not app.config['INSTRUMENTATION_ENABLED']:
+        return
+    _enabled = True
+
+    with app.app_context():
+        _install_sql_listeners(db.engine)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+        g.request_timings = {}
+
+    @app.after_request
+    def record_request_metrics(response):
+        if 'request_started' not in g:
+            return response
+
+        total = time.perf_counter() - g.request_started
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe('http_request_duration_seconds', total, method=request.method, route=route)
+        metrics.increment('http_requests_total', method=request.method, route=route,
+                          status=response.status_code)
+        metrics.observe('db_queries_per_request', g.request_timings.get('db', [0, 0.0])[0], route=route)
+
+        response.headers['Server-Timing'] = _server_timing(total, g.request_timings)
+        return response
+
+    def metrics_endpoint():
+        token = current_app.config['METRICS_TOKEN']
+        if token and request.headers.get('Authorization') != f'Bearer {token}':
+            return Response('Unauthorized\n', status=401, mimetype='text/plain')
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule(app.config['METRICS_PATH'], 'metrics', metrics_endpoint, methods=['GET'])
@@ -0,0 +1,58 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Output decodes to the same values as the stdlib provider: keys are
+    sorted, and types orjson would serialize its own way (datetimes,
+    dataclasses) go through DefaultJSONProvider.default. Non-ASCII text is
+    sent as UTF-8 rather than \\u escapes.
+    """
+
+    OPTIONS = 0
+    if orjson is not None:
+        OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                   | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            # Callers asking for stdlib options (indent, ...) get the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if self.compact is False or (self.compact is None and self._app.debug):
+            # Pretty-printed debug output keeps using the stdlib encoder
+            return super().response(obj)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.OPTIONS) + b'\n',
+            mimetype=self.mimetype
+        )
+
+
+def init_json_provider(app):
+    """Use orjson for request and response bodies when it is installed.
+
+    JSON_PROVIDER: 'auto' (orjson if available, the default), 'orjson'
+    (required) or 'stdlib'.
+    """
+    choice = app.config['JSON_PROVIDER']
+    if choice == 'stdlib':
+        return
+    if orjson is None:
+        if choice == 'orjson':
+            raise RuntimeError("JSON_PROVIDER=orjson requires the 'orjson' package")
+        return
+    app.json = OrjsonProvider(app)
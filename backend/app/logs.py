@@ -0,0 +1,243 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from flask import g, has_request_context, request
+from app.instrumentation import metrics
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+metrics.describe('log_records_dropped_total', 'Log records dropped because the log queue was full')
+
+REDACTED = '[REDACTED]'
+REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+# Attributes every LogRecord has; anything else was passed with `extra=`
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_pipeline = None
+
+
+class Redactor:
+    """Masks secrets in log messages and structured fields"""
+
+    def __init__(self, keys):
+        self.keys = tuple(key.lower() for key in keys)
+        names = '|'.join(re.escape(key) for key in self.keys)
+        self.patterns = [
+            (re.compile(r'(?i)\b(bearer|basic)\s+[A-Za-z0-9._~+/=-]+'), rf'\1 {REDACTED}'),
+            (re.compile(r'eyJ[\w-]*\.[\w-]*\.[\w-]*'), REDACTED),  # bare JWTs
+        ]
+        if names:
+            # password=..., "token": "...", 'Authorization': '...'
+            self.patterns.append((
+                re.compile(rf'''(?i)(["']?[\w-]*(?:{names})[\w-]*["']?\s*[:=]\s*)(["']?)[^"'\s,&}}]+'''),
+                rf'\1\2{REDACTED}'
+            ))
+
+    def is_secret(self, key):
+        key = str(key).lower()
+        return any(secret in key for secret in self.keys)
+
+    def text(self, value):
+        for pattern, replacement in self.patterns:
+            value = pattern.sub(replacement, value)
+        return value
+
+    def value(self, value):
+        if isinstance(value, str):
+            return self.text(value)
+        if isinstance(value, dict):
+            return {key: REDACTED if self.is_secret(key) else self.value(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.value(item) for item in value]
+        return value
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and any `extra` fields"""
+
+    def __init__(self, redactor):
+        super().__init__()
+        self.redactor = redactor
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': self.redactor.text(record.getMessage()),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = REDACTED if self.redactor.is_secret(key) else self.redactor.value(value)
+        if record.exc_info:
+            entry['exception'] = self.redactor.text(self.formatException(record.exc_info))
+        elif record.exc_text:
+            entry['exception'] = self.redactor.text(record.exc_text)
+
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human readable lines for development, redacted like the JSON ones"""
+
+    def __init__(self, redactor):
+        super().__init__('[%(asctime)s] %(levelname)s %(request_id)s %(name)s: %(message)s')
+        self.redactor = redactor
+
+    def format(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = '-'
+        return self.redactor.text(super().format(record))
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the current request and samples DEBUG records.
+
+    Runs in the thread that logs, while the request context is still
+    available. A request's DEBUG records are kept or dropped together
+    (LOG_DEBUG_SAMPLE_RATE); outside requests each record is sampled.
+    """
+
+    def __init__(self, debug_sample_rate):
+        super().__init__()
+        self.debug_sample_rate = debug_sample_rate
+
+    def filter(self, record):
+        in_request = has_request_context()
+        if record.levelno <= logging.DEBUG and self.debug_sample_rate < 1:
+            sampled = g.get('log_sampled') if in_request else None
+            if sampled is None:
+                sampled = random.random() < self.debug_sample_rate
+            if not sampled:
+                return False
+
+        if in_request and not hasattr(record, 'request_id'):
+            record.request_id = g.get('request_id')
+            record.method = request.method
+            record.path = request.path
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Hands records to the listener thread without formatting them.
+
+    The message is rendered here (arguments may change after the call), but
+    exception formatting and serialization happen on the listener thread.
+    A full queue drops the record instead of blocking the caller.
+    """
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.increment('log_records_dropped_total')
+
+
+class LogPipeline:
+    """The queue, its handler on the root logger and the listener writing to stderr"""
+
+    def __init__(self, config):
+        self.queue_size = config['LOG_QUEUE_SIZE']
+        redactor = Redactor(config['LOG_REDACT_KEYS'])
+        formatter = JsonFormatter(redactor) if config['LOG_FORMAT'] == 'json' else TextFormatter(redactor)
+        self.output = logging.StreamHandler(sys.stderr)
+        self.output.setFormatter(formatter)
+
+        self.handler = NonBlockingQueueHandler(queue.Queue(self.queue_size))
+        self.handler.addFilter(RequestContextFilter(config['LOG_DEBUG_SAMPLE_RATE']))
+        self.listener = None
+
+    def start(self):
+        self.listener = QueueListener(self.handler.queue, self.output, respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self):
+        """Write out everything still queued"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def after_fork(self):
+        # The listener thread does not survive fork and the queue's lock may
+        # have been held when it happened: start over with fresh ones
+        self.listener = None
+        self.handler.queue = queue.Queue(self.queue_size)
+        self.start()
+
+
+def init_logging(app):
+    """Send all logging through a queue to a background writer.
+
+    Request threads only enqueue records; formatting (JSON lines or text,
+    LOG_FORMAT), redaction of LOG_REDACT_KEYS and tokens, and the write to
+    stderr happen on the listener thread. Every request gets an id (from
+    X-Request-ID or generated), returned in the X-Request-ID header and
+    attached to its log records, and with LOG_REQUESTS one summary line
+    with its status and duration.
+    """
+    global _pipeline
+    config = app.config
+    root = logging.getLogger()
+    # Logging is process-wide: a second app replaces the first one's pipeline
+    if _pipeline is not None:
+        root.removeHandler(_pipeline.handler)
+        _pipeline.stop()
+    else:
+        atexit.register(lambda: _pipeline.stop())
+
+    _pipeline = pipeline = LogPipeline(config)
+    root.addHandler(pipeline.handler)
+    root.setLevel(config['LOG_LEVEL'])
+    pipeline.start()
+    app.extensions['logging'] = pipeline
+
+    # Let app.logger records reach the root handler instead of Flask's default stderr handler
+    from flask.logging import default_handler
+    app.logger.removeHandler(default_handler)
+    app.logger.setLevel(logging.DEBUG if app.debug else logging.NOTSET)
+
+    request_logger = logging.getLogger('app.request')
+    sample_rate = config['LOG_DEBUG_SAMPLE_RATE']
+
+    @app.before_request
+    def assign_request_id():
+        incoming = request.headers.get('X-Request-ID', '')
+        g.request_id = incoming if REQUEST_ID_PATTERN.match(incoming) else uuid.uuid4().hex
+        g.log_started = time.perf_counter()
+        g.log_sampled = sample_rate >= 1 or random.random() < sample_rate
+
+    @app.after_request
+    def log_request(response):
+        if 'request_id' not in g:
+            return response
+        response.headers['X-Request-ID'] = g.request_id
+        if config['LOG_REQUESTS']:
+            request_logger.info(
+                f'{request.method} {request.path} {response.status_code}',
+                extra={
+                    'status': response.status_code,
+                    'duration_ms': round((time.perf_counter() - g.log_started) * 1000, 2),
+                    'remote_addr': request.remote_addr
+                }
+            )
+        return response
+
+    return pipeline
@@ -1,5 +1,8 @@
 from app.models.user import db, User
 from app.models.review import Review
 from app.models.quote import Quote
+from app.models.outbound_email import OutboundEmail
+from app.models.review_stats import ReviewStats
+from app.models.idempotency_record import IdempotencyRecord
 
-__all__ = ['db', 'User', 'Review', 'Quote']
+__all__ = ['db', 'User', 'Review', 'Quote', 'OutboundEmail', 'ReviewStats', 'IdempotencyRecord']
@@ -0,0 +1,22 @@
+from datetime import datetime
+from app.extensions import db  # Use this import in all model files
+
+class IdempotencyRecord(db.Model):
+    """The stored response for a write, keyed by Idempotency-Key or payload hash"""
+    __tablename__ = 'idempotency_records'
+
+    id = db.Column(db.Integer, primary_key=True)
+    # '<scope>:key:<sha256 of the header>' or '<scope>:content:<payload fingerprint>'
+    key = db.Column(db.String(100), nullable=False, unique=True)
+    fingerprint = db.Column(db.String(64), nullable=False)
+    status_code = db.Column(db.Integer, nullable=False)
+    response = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Expired records are purged by age
+        db.Index('ix_idempotency_records_created_at', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f'<IdempotencyRecord {self.key}>'
@@ -0,0 +1,41 @@
+from datetime import datetime
+from app.extensions import db  # Use this import in all model files
+
+class OutboundEmail(db.Model):
+    __tablename__ = 'outbound_emails'
+
+    id = db.Column(db.Integer, primary_key=True)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    recipient = db.Column(db.String(120))
+    # Messages with a digest key are coalesced into one email by the worker
+    digest_key = db.Column(db.String(50))
+    status = db.Column(db.String(20), default='pending', nullable=False)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    last_error = db.Column(db.Text)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        # The worker polls for due messages by (status, next_attempt_at)
+        db.Index('ix_outbound_emails_status_next_attempt', 'status', 'next_attempt_at'),
+        db.Index('ix_outbound_emails_digest_key_status', 'digest_key', 'status'),
+    )
+
+    def __repr__(self):
+        return f'<OutboundEmail {self.id}: {self.status}>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'subject': self.subject,
+            'recipient': self.recipient,
+            'digest_key': self.digest_key,
+            'status': self.status,
+            'attempts': self.attempts,
+            'last_error': self.last_error,
+            'next_attempt_at': self.next_attempt_at.isoformat(),
+            'created_at': self.created_at.isoformat(),
+            'sent_at': self.sent_at.isoformat() if self.sent_at else None
+        }
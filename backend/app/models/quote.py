@@ -1,4 +1,5 @@
 from datetime import datetime
+from sqlalchemy import DDL, event
 from app.extensions import db  # Use this import in all model files
 
 class Quote(db.Model):
@@ -17,6 +18,13 @@ class Quote(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Keyset pagination on (created_at, id), optionally filtered by status or service type
+        db.Index('ix_quotes_created_at_id', 'created_at', 'id'),
+        db.Index('ix_quotes_status_created_at_id', 'status', 'created_at', 'id'),
+        db.Index('ix_quotes_service_type_created_at_id', 'service_type', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f'<Quote {self.id}: {self.name}>'
 
@@ -35,3 +43,93 @@ class Quote(db.Model):
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
+
+    @staticmethod
+    def listing_columns():
+        """Columns selected for quote listings, fetched as plain rows"""
+        return (
+            Quote.id,
+            Quote.name,
+            Quote.email,
+            Quote.phone,
+            Quote.service_type,
+            Quote.project_details,
+            Quote.preferred_contact_method,
+            Quote.budget_range,
+            Quote.timeline,
+            Quote.status,
+            Quote.created_at,
+            Quote.updated_at
+        )
+
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a `listing_columns()` row the same way as `to_dict()`"""
+        return {
+            'id': row.id,
+            'name': row.name,
+            'email': row.email,
+            'phone': row.phone,
+            'service_type': row.service_type,
+            'project_details': row.project_details,
+            'preferred_contact_method': row.preferred_contact_method,
+            'budget_range': row.budget_range,
+            'timeline': row.timeline,
+            'status': row.status,
+            'created_at': row.created_at.isoformat(),
+            'updated_at': row.updated_at.isoformat()
+        }
+
+
+# Full-text search index over name, email, service_type and project_details.
+# It lives outside the ORM and is kept in sync by the database itself, so bulk
+# inserts and deletes that bypass the ORM are indexed too. The migration
+# "add quote search" creates the same objects on existing databases.
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS quotes_fts USING fts5(
+        name, email, service_type, project_details,
+        content='quotes', content_rowid='id', tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3 4'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS quotes_fts_insert AFTER INSERT ON quotes BEGIN
+        INSERT INTO quotes_fts(rowid, name, email, service_type, project_details)
+        VALUES (new.id, new.name, new.email, new.service_type, new.project_details);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS quotes_fts_delete AFTER DELETE ON quotes BEGIN
+        INSERT INTO quotes_fts(quotes_fts, rowid, name, email, service_type, project_details)
+        VALUES ('delete', old.id, old.name, old.email, old.service_type, old.project_details);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS quotes_fts_update
+    AFTER UPDATE OF name, email, service_type, project_details ON quotes BEGIN
+        INSERT INTO quotes_fts(quotes_fts, rowid, name, email, service_type, project_details)
+        VALUES ('delete', old.id, old.name, old.email, old.service_type, old.project_details);
+        INSERT INTO quotes_fts(rowid, name, email, service_type, project_details)
+        VALUES (new.id, new.name, new.email, new.service_type, new.project_details);
+    END
+    """,
+]
+
+POSTGRES_SEARCH_DDL = [
+    # Names and emails are matched as written ('simple'), descriptions are stemmed
+    """
+    ALTER TABLE quotes ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(email, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(service_type, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(project_details, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_quotes_search_vector ON quotes USING gin (search_vector)",
+]
+
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Quote.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(Quote.__table__, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+event.listen(Quote.__table__, 'before_drop', DDL('DROP TABLE IF EXISTS quotes_fts').execute_if(dialect='sqlite'))
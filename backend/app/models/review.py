@@ -12,6 +12,13 @@ class Review(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
 
+    __table_args__ = (
+        # Listing pages: newest first, or highest rating first
+        db.Index('ix_reviews_created_at_id', 'created_at', 'id'),
+        db.Index('ix_reviews_rating_created_at_id', 'rating', 'created_at', 'id'),
+        db.Index('ix_reviews_user_id', 'user_id'),
+    )
+
     author = db.relationship(
         'User',
         backref=db.backref('reviews', lazy=True, cascade='all, delete-orphan'),
@@ -32,3 +39,32 @@ class Review(db.Model):
             'user_id': self.user_id,
             'author': self.author.username if self.author else 'Anonymous'
         }
+
+    @staticmethod
+    def listing_columns():
+        """Columns selected for review listings; join User to get the author"""
+        from app.models.user import User
+        return (
+            Review.id,
+            Review.title,
+            Review.content,
+            Review.rating,
+            Review.created_at,
+            Review.updated_at,
+            Review.user_id,
+            User.username
+        )
+
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a `listing_columns()` row the same way as `to_dict()`"""
+        return {
+            'id': row.id,
+            'title': row.title,
+            'content': row.content,
+            'rating': row.rating,
+            'created_at': row.created_at.isoformat(),
+            'updated_at': row.updated_at.isoformat(),
+            'user_id': row.user_id,
+            'author': row.username or 'Anonymous'
+        }
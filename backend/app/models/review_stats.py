@@ -0,0 +1,36 @@
+from datetime import datetime
+from app.extensions import db  # Use this import in all model files
+
+class ReviewStats(db.Model):
+    """Single-row running aggregate over all reviews (id is always 1)"""
+    __tablename__ = 'review_stats'
+
+    id = db.Column(db.Integer, primary_key=True)
+    review_count = db.Column(db.Integer, default=0, nullable=False)
+    rating_sum = db.Column(db.Float, default=0, nullable=False)
+    rating_1 = db.Column(db.Integer, default=0, nullable=False)
+    rating_2 = db.Column(db.Integer, default=0, nullable=False)
+    rating_3 = db.Column(db.Integer, default=0, nullable=False)
+    rating_4 = db.Column(db.Integer, default=0, nullable=False)
+    rating_5 = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ReviewStats count={self.review_count}>'
+
+    @staticmethod
+    def bucket_column(rating):
+        """Histogram column for a rating, rounding half up and clamping to 1-5"""
+        star = min(max(int(float(rating) + 0.5), 1), 5)
+        return f'rating_{star}'
+
+    def to_dict(self):
+        distribution = {str(star): getattr(self, f'rating_{star}') for star in range(1, 6)}
+        count = self.review_count
+        return {
+            'count': count,
+            'average_rating': round(self.rating_sum / count, 2) if count else None,
+            'distribution': distribution,
+            'satisfaction_rate': round((self.rating_4 + self.rating_5) * 100 / count) if count else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
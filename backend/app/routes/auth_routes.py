@@ -1,23 +1,23 @@
 from flask import Blueprint, jsonify, request
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models.user import User
 from app.extensions import db
+from app.decorators import rate_limit, json_field
+from app.services.password_hasher import PasswordHasherBusy
+from app.utils.auth import create_user_token
+from app.utils.validators import LOGIN_SCHEMA, REGISTER_SCHEMA, ValidationError, login_emails
 
 auth_routes = Blueprint('auth', __name__)
 
 @auth_routes.route('/register', methods=['POST'])
+@rate_limit('RATE_LIMIT_REGISTER_PER_IP')
 def register():
     try:
-        data = request.get_json()
-        email = data.get('email')
-        username = data.get('username')
-        password = data.get('password')
-
-        if not email or not username or not password:
-            return jsonify({
-                'success': False,
-                'error': 'Missing required fields'
-            }), 400
+        # Rejects malformed payloads before any query or password hashing
+        fields = REGISTER_SCHEMA.load(request.get_json(silent=True))
+        email = fields['email']
+        username = fields['username']
+        password = fields['password']
 
         # Check if user already exists
         if User.query.filter_by(email=email).first():
@@ -43,7 +43,7 @@ def register():
         db.session.commit()
 
         # Generate access token
-        access_token = create_access_token(identity=user.id)
+        access_token = create_user_token(user)
 
         return jsonify({
             'success': True,
@@ -54,6 +54,19 @@ def register():
             }
         }), 201
 
+    except ValidationError as e:
+        return jsonify({
+            'success': False,
+            'error': e.message
+        }), e.status_code
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        response = jsonify({
+            'success': False,
+            'error': str(e)
+        })
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 503
     except Exception as e:
         db.session.rollback()
         return jsonify({
@@ -62,20 +75,19 @@ def register():
         }), 500
 
 @auth_routes.route('/login', methods=['POST'])
+@rate_limit('RATE_LIMIT_LOGIN_PER_IP')
+@rate_limit('RATE_LIMIT_LOGIN_PER_ACCOUNT', key_func=json_field('email'))
 def login():
     try:
-        data = request.get_json()
-        email = data.get('email')
-        password = data.get('password')
-
-        if not email or not password:
-            return jsonify({
-                'success': False,
-                'error': 'Missing required fields'
-            }), 400
+        fields = LOGIN_SCHEMA.load(request.get_json(silent=True))
+        password = fields['password']
 
-        # Find user by email
-        user = User.query.filter_by(email=email).first()
+        # Find user by email, as registration normalized it or as typed
+        user = None
+        for email in login_emails(fields['email']):
+            user = User.query.filter_by(email=email).first()
+            if user is not None:
+                break
 
         if not user or not user.check_password(password):  # Use the check_password method
             return jsonify({
@@ -83,8 +95,17 @@ def login():
                 'error': 'Invalid email or password'
             }), 401
 
+        # Upgrade hashes made with old parameters while we have the plaintext
+        if user.password_needs_rehash():
+            try:
+                user.set_password(password)
+                db.session.commit()
+            except PasswordHasherBusy:
+                # Not worth failing the login over; try again next time
+                db.session.rollback()
+
         # Generate access token
-        access_token = create_access_token(identity=user.id)
+        access_token = create_user_token(user)
 
         return jsonify({
             'success': True,
@@ -95,7 +116,21 @@ def login():
             }
         }), 200
 
+    except ValidationError as e:
+        return jsonify({
+            'success': False,
+            'error': e.message
+        }), e.status_code
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        response = jsonify({
+            'success': False,
+            'error': str(e)
+        })
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 503
     except Exception as e:
+        db.session.rollback()
         return jsonify({
             'success': False,
             'error': str(e)
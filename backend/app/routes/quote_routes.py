@@ -1,63 +1,40 @@
-from flask import Blueprint, jsonify, request
+from datetime import datetime
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 from flask_cors import cross_origin
-from app.models.quote import Quote
-from app.services.email_service import EmailService
-from app.extensions import db
+from flask_jwt_extended import jwt_required
+from app.services.quote_service import QuoteService
+from app.services.quote_transfer import iter_buffered, iter_csv, iter_gzip, iter_ndjson, iter_quote_rows
+from app.utils.pagination import PaginationError, parse_datetime, parse_limit
+from app.utils.validators import ValidationError
+from app.extensions import db, cache, events
+from app.decorators import admin_required, rate_limit, json_field
 
 quote_routes = Blueprint('quotes', __name__)
 
 @quote_routes.route('', methods=['POST'])  # Just empty string since prefix handles full path
 @cross_origin()
+@rate_limit('RATE_LIMIT_QUOTE_PER_IP')
+@rate_limit('RATE_LIMIT_QUOTE_PER_EMAIL', key_func=json_field('email'))
 def create_quote():
     try:
-        data = request.get_json()
-
-        # Validate required fields
-        required_fields = ['name', 'email', 'phone', 'serviceType', 'projectDetails']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    'success': False,
-                    'error': f'Missing required field: {field}'
-                }), 400
-
-        # Create new quote
-        new_quote = Quote(
-            name=data['name'],
-            email=data['email'],
-            phone=data['phone'],
-            service_type=data['serviceType'],
-            project_details=data['projectDetails'],
-            preferred_contact_method=data.get('preferredContactMethod', 'email'),
-            budget_range=data.get('budgetRange'),
-            timeline=data.get('timeline')
-        )
-
-        db.session.add(new_quote)
-        db.session.commit()
-
-        # Send email notification
-        email_body = f"""
-        New Quote Request:
+        quote, replayed = QuoteService.create(request.get_json(silent=True),
+                                              idempotency_key=request.headers.get('Idempotency-Key'))
 
-        Name: {new_quote.name}
-        Email: {new_quote.email}
-        Phone: {new_quote.phone}
-        Service Type: {new_quote.service_type}
-        Project Details: {new_quote.project_details}
-        Preferred Contact: {new_quote.preferred_contact_method}
-        Budget Range: {new_quote.budget_range or 'Not specified'}
-        Timeline: {new_quote.timeline or 'Not specified'}
-        """
-
-        EmailService.send_email('New Quote Request', email_body)
-
-        return jsonify({
+        response = jsonify({
             'success': True,
             'message': 'Quote request submitted successfully',
-            'data': new_quote.to_dict()
-        }), 201
+            'data': quote
+        })
+        if replayed:
+            # A repeat of an earlier submission: nothing was stored or emailed
+            response.headers['Idempotent-Replayed'] = 'true'
+        return response, 201
 
+    except ValidationError as e:
+        return jsonify({
+            'success': False,
+            'error': e.message
+        }), e.status_code
     except Exception as e:
         db.session.rollback()
         return jsonify({
@@ -67,16 +44,149 @@ def create_quote():
 
 @quote_routes.route('', methods=['GET'])  # Just empty string since prefix handles full path
 @cross_origin()
+@jwt_required()
+@admin_required()
+@cache.cached('quotes')
 def get_quotes():
+    """List quotes newest first, one keyset page at a time (admin only).
+
+    Query params: limit, cursor (from the previous page's next_cursor),
+    status, service_type, created_after, created_before.
+    """
     try:
-        quotes = Quote.query.order_by(Quote.created_at.desc()).all()
+        limit = parse_limit(request.args.get('limit'))
+        rows, next_cursor = QuoteService.list_page(
+            limit,
+            cursor=request.args.get('cursor'),
+            status=request.args.get('status'),
+            service_type=request.args.get('service_type'),
+            created_after=parse_datetime(request.args.get('created_after'), 'created_after'),
+            created_before=parse_datetime(request.args.get('created_before'), 'created_before')
+        )
+
         return jsonify({
             'success': True,
             'message': 'Quotes retrieved successfully',
-            'data': [quote.to_dict() for quote in quotes]
+            'data': QuoteService.serialize(rows),
+            'pagination': {
+                'limit': limit,
+                'has_more': next_cursor is not None,
+                'next_cursor': next_cursor
+            }
         }), 200
+    except PaginationError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
+
+@quote_routes.route('/search', methods=['GET'])
+@cross_origin()
+@jwt_required()
+@admin_required()
+@cache.cached('quotes')
+def search_quotes():
+    """Full-text search, best match first (admin only).
+
+    Query params: q (words matched as prefixes, all required), limit,
+    cursor (from the previous page's next_cursor) and status. Only the
+    newest SEARCH_RANK_WINDOW matches are ranked; later pages continue
+    with older matches, newest first.
+    """
+    try:
+        limit = parse_limit(request.args.get('limit'), default=20, maximum=100)
+        rows, next_cursor = QuoteService.search(
+            request.args.get('q'),
+            limit,
+            cursor=request.args.get('cursor'),
+            status=request.args.get('status')
+        )
+
+        return jsonify({
+            'success': True,
+            'data': QuoteService.serialize(rows),
+            'pagination': {
+                'limit': limit,
+                'has_more': next_cursor is not None,
+                'next_cursor': next_cursor
+            }
+        }), 200
+    except PaginationError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@quote_routes.route('/stream', methods=['GET'])
+@cross_origin()
+@jwt_required(locations=['headers', 'query_string'])
+@admin_required()
+def stream_quotes():
+    """Push newly created quotes as server-sent events (admin only).
+
+    Each 'quote.created' event carries the quote as JSON. Send the last
+    event id seen (Last-Event-ID header, or ?last_event_id=) to resume
+    without gaps; a 'reset' event means events were missed and the list
+    should be reloaded. The stream never queries the database. Browsers'
+    EventSource cannot set an Authorization header, so this route also
+    accepts the access token as ?token=.
+    """
+    config = current_app.config
+    last_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    body = events.stream('quotes', last_id, max_duration=config['SSE_MAX_DURATION'], retry=config['SSE_RETRY'])
+
+    response = Response(body, mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['X-Accel-Buffering'] = 'no'  # stop nginx from buffering events
+    return response
+
+EXPORT_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+@quote_routes.route('/export', methods=['GET'])
+@cross_origin()
+@jwt_required()
+@admin_required()
+def export_quotes():
+    """Stream every quote as NDJSON or CSV (?format=ndjson|csv, optional ?status=).
+
+    Rows go from a server-side cursor straight into the response, so memory
+    stays flat and the first bytes are sent immediately. The body is gzipped
+    when the client accepts it, unless ?gzip=false.
+    """
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in EXPORT_MIMETYPES:
+        return jsonify({
+            'success': False,
+            'error': f'format must be one of: {", ".join(EXPORT_MIMETYPES)}'
+        }), 400
+
+    rows = iter_quote_rows(batch_size=current_app.config['QUOTE_EXPORT_BATCH_SIZE'],
+                           status=request.args.get('status'))
+    chunks = iter_buffered(iter_csv(rows) if fmt == 'csv' else iter_ndjson(rows))
+
+    use_gzip = (request.args.get('gzip', 'true').lower() != 'false'
+                and 'gzip' in request.accept_encodings)
+    body = iter_gzip(chunks) if use_gzip else chunks
+
+    filename = f"quotes-{datetime.utcnow():%Y%m%d-%H%M%S}.{fmt}"
+    response = Response(stream_with_context(body), mimetype=EXPORT_MIMETYPES[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['Vary'] = 'Accept-Encoding'
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
@@ -1,19 +1,59 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models.review import Review
-from app.models.user import User
-from app.extensions import db
-import logging
+from app.extensions import db, cache
+from app.services.review_service import ReviewPermissionError, ReviewService
+from app.services.review_stats_service import ReviewStatsService
+from app.utils.auth import current_user_is_admin
+from app.utils.pagination import PaginationError, parse_limit
+from app.utils.validators import ValidationError
 
 review_routes = Blueprint('reviews', __name__)
 
 @review_routes.route('', methods=['GET'])
+@cache.cached('reviews')
 def get_reviews():
-    reviews = Review.query.all()
-    return jsonify({
-        'success': True,
-        'data': [review.to_dict() for review in reviews]
-    })
+    """List reviews one keyset page at a time.
+
+    Query params: limit, cursor (from the previous page's next_cursor) and
+    sort ('newest', the default, or 'rating' for highest rated first).
+    """
+    try:
+        limit = parse_limit(request.args.get('limit'), default=20, maximum=100)
+        sort = request.args.get('sort', 'newest')
+        rows, next_cursor = ReviewService.list_page(limit, cursor=request.args.get('cursor'), sort=sort)
+
+        return jsonify({
+            'success': True,
+            'data': ReviewService.serialize(rows),
+            'pagination': {
+                'limit': limit,
+                'sort': sort,
+                'has_more': next_cursor is not None,
+                'next_cursor': next_cursor
+            }
+        })
+    except PaginationError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@review_routes.route('/stats', methods=['GET'])
+@cache.cached('reviews')
+def get_review_stats():
+    """Count, average and 1-5 star distribution, served from a precomputed aggregate"""
+    try:
+        return jsonify({
+            'success': True,
+            'data': ReviewStatsService.get().to_dict()
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
 
 @review_routes.route('', methods=['POST', 'OPTIONS'])
 @jwt_required()
@@ -22,57 +62,9 @@ def create_review():
         return jsonify({"status": "ok"}), 200
 
     try:
-        # Debug logging
-        print("Headers received:", dict(request.headers))
-        data = request.get_json()
-        print("Data received:", data)
         current_user_id = get_jwt_identity()
-        print("Current user ID:", current_user_id)
-
-        # Validate data presence
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 422
-
-        # Validate required fields
-        required_fields = ['title', 'content', 'rating']
-        missing_fields = [field for field in required_fields if field not in data]
-        if missing_fields:
-            return jsonify({
-                'success': False,
-                'error': f'Missing required fields: {", ".join(missing_fields)}'
-            }), 422
-
-        # Validate rating
-        rating = data.get('rating')
-        if not isinstance(rating, (int, float)) or not (1 <= float(rating) <= 5):
-            return jsonify({
-                'success': False,
-                'error': f'Invalid rating value: {rating}. Must be between 1 and 5'
-            }), 422
-
-        # Validate user existence
-        user = User.query.get(current_user_id)
-        if not user:
-            return jsonify({
-                'success': False,
-                'error': 'User not found'
-            }), 422
-
-        # Create review
-        review = Review(
-            title=data['title'],
-            content=data['content'],
-            rating=float(rating),
-            user_id=current_user_id
-        )
-
-        print("Creating review:", review)
-        db.session.add(review)
-        db.session.commit()
-        print("Review created successfully")
+        review = ReviewService.create(current_user_id, request.get_json(silent=True))
+        current_app.logger.debug("Review created", extra={'review_id': review.id, 'user_id': current_user_id})
 
         return jsonify({
             'success': True,
@@ -80,8 +72,13 @@ def create_review():
             'data': review.to_dict()
         }), 201
 
+    except ValidationError as e:
+        return jsonify({
+            'success': False,
+            'error': e.message
+        }), e.status_code
     except Exception as e:
-        print(f"Error in create_review: {str(e)}")
+        current_app.logger.exception(f"Error in create_review: {str(e)}")
         db.session.rollback()
         return jsonify({
             'success': False,
@@ -92,34 +89,9 @@ def create_review():
 @review_routes.route('/<int:review_id>', methods=['PUT'])  # Fixed route path
 @jwt_required()
 def update_review(review_id):
+    review = db.get_or_404(Review, review_id)
     try:
-        current_user_id = get_jwt_identity()
-        review = Review.query.get_or_404(review_id)
-
-        # Check if the user owns this review
-        if review.user_id != current_user_id:
-            return jsonify({
-                'success': False,
-                'error': 'Unauthorized'
-            }), 403
-
-        data = request.get_json()
-
-        # Update allowed fields
-        if 'title' in data:
-            review.title = data['title']
-        if 'content' in data:
-            review.content = data['content']
-        if 'rating' in data:
-            if 1 <= data['rating'] <= 5:
-                review.rating = data['rating']
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': 'Rating must be between 1 and 5'
-                }), 400
-
-        db.session.commit()
+        review = ReviewService.update(review, get_jwt_identity(), request.get_json(silent=True))
 
         return jsonify({
             'success': True,
@@ -134,6 +106,17 @@ def update_review(review_id):
             }
         }), 200
 
+    except ReviewPermissionError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 403
+    except ValidationError as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': e.message
+        }), e.status_code
     except Exception as e:
         db.session.rollback()
         return jsonify({
@@ -144,27 +127,22 @@ def update_review(review_id):
 @review_routes.route('/<int:review_id>', methods=['DELETE'])  # Fixed route path
 @jwt_required()
 def delete_review(review_id):
+    review = db.get_or_404(Review, review_id)
     try:
-        current_user_id = get_jwt_identity()
-        review = Review.query.get_or_404(review_id)
-        user = User.query.get(current_user_id)
-
-        # Check if user is admin or the owner of the review
-        if not (user.is_admin or review.user_id == current_user_id):
-            return jsonify({
-                'success': False,
-                'error': 'Unauthorized: You must be an admin or the review owner to delete this review'
-            }), 403
-
-        db.session.delete(review)
-        db.session.commit()
+        is_admin = current_user_is_admin()
+        ReviewService.delete(review, get_jwt_identity(), is_admin=is_admin)
 
         return jsonify({
             'success': True,
             'message': 'Review deleted successfully',
-            'deleted_by': 'admin' if user.is_admin else 'owner'
+            'deleted_by': 'admin' if is_admin else 'owner'
         }), 200
 
+    except ReviewPermissionError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 403
     except Exception as e:
         db.session.rollback()
         return jsonify({
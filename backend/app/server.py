@@ -0,0 +1,95 @@
+import time
+from sqlalchemy import text
+from app.extensions import db, events
+from app.services.email_service import EmailService
+
+# A representative quote payload; validating it loads email-validator's tables
+SAMPLE_QUOTE = {
+    'name': 'Warm Up',
+    'email': 'warm-up@example.com',
+    'phone': '555-010-0000',
+    'serviceType': 'Roofing',
+    'projectDetails': 'Warm-up request',
+}
+WARM_UP_PATHS = ['/api/quotes', '/api/quotes/search', '/api/reviews', '/api/reviews/stats', '/api/auth/login']
+
+
+def warm_up(app):
+    """Pay first-request costs before serving traffic.
+
+    Builds the URL matcher, the payload validators, SQLAlchemy's compiled
+    statement cache for the hot read queries and the JSON encoder. Run it
+    before workers fork (gunicorn preload) and the results are shared
+    copy-on-write. Failures are logged, never fatal: a database that is not
+    up yet must not stop the server from starting.
+    """
+    from app.services.quote_service import QuoteService
+    from app.services.review_service import ReviewService
+    from app.services.review_stats_service import ReviewStatsService
+    from app.utils.validators import QUOTE_SCHEMA
+
+    started = time.perf_counter()
+    adapter = app.url_map.bind('localhost')
+    for path in WARM_UP_PATHS:
+        adapter.match(path, method='POST' if path.endswith('login') else 'GET')
+    QUOTE_SCHEMA.load(SAMPLE_QUOTE)
+
+    try:
+        with app.app_context():
+            db.session.execute(text('SELECT 1'))
+            quotes, _ = QuoteService.list_page(1)
+            reviews, _ = ReviewService.list_page(1)
+            app.json.dumps({
+                'quotes': QuoteService.serialize(quotes),
+                'reviews': ReviewService.serialize(reviews),
+                'stats': ReviewStatsService.get().to_dict()
+            })
+            db.session.rollback()
+    except Exception as e:
+        app.logger.warning(f"Warm-up queries failed: {str(e)}")
+    app.logger.info(f"Warm-up finished in {time.perf_counter() - started:.2f}s")
+
+
+def after_fork(app):
+    """Reset per-process resources inherited from a preloaded parent.
+
+    Database and SMTP connections opened before the fork are dropped
+    without being closed (they belong to the parent), and the log writer
+    and background workers, whose threads do not survive fork, are
+    started afresh.
+    """
+    app.extensions['logging'].after_fork()
+    with app.app_context():
+        db.engine.dispose(close=False)
+    EmailService.discard_pool()
+    events.after_fork()
+
+    if app.config['EMAIL_WORKER_IN_PROCESS']:
+        from app.services.email_queue import EmailWorker
+        app.extensions['email_worker'] = EmailWorker(app).start()
+    if app.config['SCHEDULER_IN_PROCESS']:
+        app.extensions['scheduler'].start()
+
+
+def stop_background(app, drain_timeout=0):
+    """Stop the in-process scheduler and email worker, if they are running"""
+    app.extensions['scheduler'].stop()
+
+    email_worker = app.extensions.get('email_worker')
+    if email_worker is not None:
+        email_worker.stop(drain_timeout=drain_timeout)
+    else:
+        EmailService.close_pool()
+
+
+def shutdown(app):
+    """Release everything once the server has stopped accepting requests.
+
+    The in-process email worker keeps sending what is due for up to
+    SHUTDOWN_EMAIL_DRAIN_TIMEOUT seconds; anything left stays in the outbox
+    for the next worker.
+    """
+    stop_background(app, app.config['SHUTDOWN_EMAIL_DRAIN_TIMEOUT'])
+    with app.app_context():
+        db.engine.dispose()
+    app.extensions['logging'].stop()
@@ -0,0 +1,77 @@
+import asyncio
+from app.config import Config
+from app.instrumentation import timed
+from app.services.email_service import EmailService
+
+try:
+    import aiosmtplib
+except ImportError:  # optional dependency, required only for EMAIL_SENDER=async
+    aiosmtplib = None
+
+
+class AsyncEmailService:
+    """Delivers a batch of emails concurrently from a single thread.
+
+    Up to `concurrency` SMTP sessions are open at once, each sending its
+    share of the batch one message after another, so a slow relay costs
+    sockets rather than threads. Used by the outbox worker when
+    EMAIL_SENDER=async.
+    """
+
+    @staticmethod
+    def check_available():
+        if aiosmtplib is None:
+            raise RuntimeError("EMAIL_SENDER=async requires the 'aiosmtplib' package")
+
+    @staticmethod
+    def connect():
+        return aiosmtplib.SMTP(
+            hostname=Config.MAIL_SERVER,
+            port=Config.MAIL_PORT,
+            username=Config.MAIL_USERNAME or None,
+            password=Config.MAIL_PASSWORD or None,
+            start_tls=Config.MAIL_USE_TLS,
+            timeout=Config.SMTP_TIMEOUT
+        )
+
+    @staticmethod
+    async def _session(pending, results):
+        client = None
+        try:
+            while pending:
+                message = pending.pop()
+                try:
+                    msg = EmailService.build_message(message['subject'], message['body'], message['recipient'])
+                    # Same smtp metric as EmailService.deliver; includes connecting when a session starts
+                    with timed('smtp'):
+                        if client is None:
+                            client = AsyncEmailService.connect()
+                            await client.connect()
+                        await client.sendmail(Config.MAIL_USERNAME, msg['To'], msg.as_string())
+                    results[message['id']] = None
+                except Exception as e:
+                    results[message['id']] = str(e) or e.__class__.__name__
+                    # The session may be unusable; the next message opens a new one
+                    if client is not None:
+                        client.close()
+                        client = None
+        finally:
+            if client is not None:
+                try:
+                    await client.quit()
+                except aiosmtplib.SMTPException:
+                    client.close()
+
+    @staticmethod
+    async def deliver_many_async(messages, concurrency):
+        pending = list(reversed(messages))
+        results = {}
+        sessions = min(concurrency, len(messages))
+        await asyncio.gather(*(AsyncEmailService._session(pending, results) for _ in range(sessions)))
+        return [(message, results[message['id']]) for message in messages]
+
+    @staticmethod
+    def deliver_many(messages, concurrency):
+        """Send outbox messages, returning (message, error or None) pairs in order"""
+        AsyncEmailService.check_available()
+        return asyncio.run(AsyncEmailService.deliver_many_async(messages, concurrency))
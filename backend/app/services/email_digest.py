@@ -0,0 +1,89 @@
+import textwrap
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from app.extensions import db
+from app.models.outbound_email import OutboundEmail
+
+class EmailDigest:
+    """Coalesces outbox messages that share a digest key into a single email.
+
+    A digest is flushed once its oldest message is older than the digest
+    window, once it holds `QUOTE_DIGEST_MAX_ITEMS` messages, or when forced
+    (e.g. on worker shutdown). The combined email goes back through the
+    outbox, so it gets the usual retries.
+    """
+
+    @staticmethod
+    def flush(config, force=False):
+        """Turn every due digest into a queued email. Returns the number of emails queued."""
+        now = datetime.utcnow()
+        window_start = now - timedelta(seconds=config['QUOTE_DIGEST_WINDOW'])
+        max_items = config['QUOTE_DIGEST_MAX_ITEMS']
+
+        groups = db.session.query(
+            OutboundEmail.digest_key,
+            OutboundEmail.recipient,
+            func.count(OutboundEmail.id),
+            func.min(OutboundEmail.created_at)
+        ).filter(
+            OutboundEmail.digest_key.isnot(None),
+            OutboundEmail.status == 'pending'
+        ).group_by(OutboundEmail.digest_key, OutboundEmail.recipient).all()
+
+        queued = 0
+        for digest_key, recipient, count, oldest in groups:
+            if not (force or count >= max_items or oldest <= window_start):
+                continue
+
+            while True:
+                items = OutboundEmail.query.filter(
+                    OutboundEmail.digest_key == digest_key,
+                    OutboundEmail.recipient == recipient if recipient is not None
+                    else OutboundEmail.recipient.is_(None),
+                    OutboundEmail.status == 'pending'
+                ).order_by(OutboundEmail.created_at, OutboundEmail.id).limit(max_items).all()
+                if not items:
+                    break
+                # A partial chunk waits for its window unless we are forcing a flush
+                if len(items) < max_items and not (force or items[0].created_at <= window_start):
+                    break
+
+                # Conditional update so two workers never put an item in two digests
+                claimed_ids = [item.id for item in items]
+                claimed = OutboundEmail.query.filter(
+                    OutboundEmail.id.in_(claimed_ids),
+                    OutboundEmail.status == 'pending'
+                ).update({'status': 'digested'}, synchronize_session=False)
+                if claimed != len(claimed_ids):
+                    db.session.rollback()
+                    break
+
+                db.session.add(EmailDigest.build_email(items, recipient, now))
+                db.session.commit()
+                queued += 1
+
+                if len(items) < max_items:
+                    break
+
+        return queued
+
+    @staticmethod
+    def build_email(items, recipient, now):
+        if len(items) == 1:
+            subject = items[0].subject
+        else:
+            subject = f"{items[0].subject} ({len(items)} in digest)"
+
+        header = (
+            f"{len(items)} notification(s) received between "
+            f"{items[0].created_at.isoformat()} and {items[-1].created_at.isoformat()} (UTC)"
+        )
+        separator = "\n" + "-" * 40 + "\n"
+        body = header + separator + separator.join(textwrap.dedent(item.body).strip() for item in items)
+
+        return OutboundEmail(
+            subject=subject,
+            body=body,
+            recipient=recipient,
+            next_attempt_at=now
+        )
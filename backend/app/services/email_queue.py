@@ -0,0 +1,213 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.outbound_email import OutboundEmail
+from app.services.async_email_service import AsyncEmailService
+from app.services.email_digest import EmailDigest
+from app.services.email_service import EmailService
+
+class EmailQueue:
+    """Persistent outbox for notification emails.
+
+    Routes enqueue messages inside their own transaction, so the email row is
+    committed together with the data it describes. A worker drains the outbox
+    and does the SMTP round trips off the request path.
+    """
+
+    @staticmethod
+    def enqueue(subject, body, to_email=None, digest_key=None):
+        """Add an email to the outbox. The caller is responsible for committing.
+
+        Messages with a `digest_key` are not sent on their own; the worker
+        batches them into a digest (see EmailDigest).
+        """
+        email = OutboundEmail(
+            subject=subject,
+            body=body,
+            recipient=to_email,
+            digest_key=digest_key,
+            next_attempt_at=datetime.utcnow()
+        )
+        db.session.add(email)
+        return email
+
+    @staticmethod
+    def backoff_delay(attempts, config):
+        """Exponential backoff: base, 2*base, 4*base, ... capped at the max delay"""
+        delay = config['EMAIL_RETRY_BASE_DELAY'] * (2 ** max(attempts - 1, 0))
+        return min(delay, config['EMAIL_RETRY_MAX_DELAY'])
+
+    @staticmethod
+    def claim_batch(config):
+        """Claim due messages for this worker and return them as plain dicts.
+
+        Messages stuck in 'sending' past their lease (e.g. the worker crashed)
+        become due again once the lease expires.
+        """
+        now = datetime.utcnow()
+        lease_until = now + timedelta(seconds=config['EMAIL_SEND_LEASE'])
+
+        candidates = db.session.query(OutboundEmail.id).filter(
+            OutboundEmail.digest_key.is_(None),
+            OutboundEmail.status.in_(['pending', 'sending']),
+            OutboundEmail.next_attempt_at <= now
+        ).order_by(OutboundEmail.next_attempt_at).limit(config['EMAIL_WORKER_BATCH_SIZE']).all()
+
+        claimed = []
+        for (email_id,) in candidates:
+            # Conditional update so concurrent workers never claim the same row
+            updated = OutboundEmail.query.filter(
+                OutboundEmail.id == email_id,
+                OutboundEmail.status.in_(['pending', 'sending']),
+                OutboundEmail.next_attempt_at <= now
+            ).update({
+                'status': 'sending',
+                'next_attempt_at': lease_until,
+                'attempts': OutboundEmail.attempts + 1
+            }, synchronize_session=False)
+            if updated:
+                claimed.append(email_id)
+        db.session.commit()
+
+        if not claimed:
+            return []
+
+        emails = OutboundEmail.query.filter(OutboundEmail.id.in_(claimed)).all()
+        return [{
+            'id': email.id,
+            'subject': email.subject,
+            'body': email.body,
+            'recipient': email.recipient,
+            'attempts': email.attempts
+        } for email in emails]
+
+    @staticmethod
+    def record_result(message, error, config):
+        """Mark a claimed message as sent, or schedule a retry / give up"""
+        email = db.session.get(OutboundEmail, message['id'])
+        if email is None:
+            return
+
+        now = datetime.utcnow()
+        if error is None:
+            email.status = 'sent'
+            email.sent_at = now
+            email.last_error = None
+        elif email.attempts >= config['EMAIL_MAX_ATTEMPTS']:
+            email.status = 'failed'
+            email.last_error = error
+        else:
+            email.status = 'pending'
+            email.last_error = error
+            email.next_attempt_at = now + timedelta(
+                seconds=EmailQueue.backoff_delay(email.attempts, config)
+            )
+
+    @staticmethod
+    def process_batch(app, executor=None, flush_digests=False):
+        """Claim one batch, send it (optionally in parallel) and record results.
+
+        Due digests are folded into single emails first. Returns the number of
+        messages processed.
+        """
+        config = app.config
+        with app.app_context():
+            if config['QUOTE_DIGEST_ENABLED'] or flush_digests:
+                EmailDigest.flush(config, force=flush_digests)
+            messages = EmailQueue.claim_batch(config)
+
+        if not messages:
+            return 0
+
+        def send(message):
+            try:
+                EmailService.deliver(message['subject'], message['body'], message['recipient'])
+                return message, None
+            except Exception as e:
+                return message, str(e) or e.__class__.__name__
+
+        # SMTP work happens outside of any DB session
+        if config['EMAIL_SENDER'] == 'async':
+            results = AsyncEmailService.deliver_many(messages, config['EMAIL_ASYNC_CONCURRENCY'])
+        elif executor is not None:
+            results = list(executor.map(send, messages))
+        else:
+            results = [send(message) for message in messages]
+
+        with app.app_context():
+            try:
+                for message, error in results:
+                    EmailQueue.record_result(message, error, config)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+        return len(messages)
+
+
+class EmailWorker:
+    """Drains the outbox in a background thread.
+
+    Each batch is sent by a pool of SMTP sender threads, or with
+    EMAIL_SENDER=async by concurrent sessions on one event loop.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.poll_interval = app.config['EMAIL_WORKER_POLL_INTERVAL']
+        self.executor = None
+        if app.config['EMAIL_SENDER'] == 'async':
+            AsyncEmailService.check_available()
+        else:
+            self.executor = ThreadPoolExecutor(
+                max_workers=app.config['EMAIL_WORKER_THREADS'],
+                thread_name_prefix='email-sender'
+            )
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self, flush_digests=False):
+        try:
+            return EmailQueue.process_batch(self.app, self.executor, flush_digests)
+        except Exception as e:
+            self.app.logger.exception(f"Email worker batch failed: {str(e)}")
+            return 0
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            # Keep draining while there is work, otherwise sleep until the next poll
+            if not self.run_once():
+                pool = EmailService.get_pool()
+                if pool is not None:
+                    pool.prune()
+                self._stop.wait(self.poll_interval)
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name='email-worker', daemon=True)
+            self._thread.start()
+        return self
+
+    def drain(self, timeout):
+        """Keep sending due messages until none are left or `timeout` seconds pass"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.run_once():
+            pass
+
+    def stop(self, timeout=None, drain_timeout=0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        # Flush pending digests so nothing waits for the next worker to start
+        if self.app.config['QUOTE_DIGEST_ENABLED']:
+            self.run_once(flush_digests=True)
+        if drain_timeout > 0:
+            self.drain(drain_timeout)
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        EmailService.close_pool()
@@ -1,13 +1,60 @@
+import logging
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.config import Config
+from app.instrumentation import timed
+from app.services.smtp_pool import SMTPConnectionPool
+
+logger = logging.getLogger(__name__)
 
 class EmailService:
+    _pool = None
+    _pool_lock = threading.Lock()
+
+    @classmethod
+    def get_pool(cls):
+        """Return the process-wide SMTP pool, or None when pooling is disabled"""
+        if Config.SMTP_POOL_SIZE <= 0:
+            return None
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    cls._pool = SMTPConnectionPool(
+                        Config.MAIL_SERVER,
+                        Config.MAIL_PORT,
+                        username=Config.MAIL_USERNAME,
+                        password=Config.MAIL_PASSWORD,
+                        use_tls=Config.MAIL_USE_TLS,
+                        size=Config.SMTP_POOL_SIZE,
+                        idle_timeout=Config.SMTP_POOL_IDLE_TIMEOUT,
+                        noop_after=Config.SMTP_POOL_NOOP_AFTER,
+                        timeout=Config.SMTP_TIMEOUT
+                    )
+        return cls._pool
+
+    @classmethod
+    def close_pool(cls):
+        with cls._pool_lock:
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.close()
+
+    @classmethod
+    def discard_pool(cls):
+        """Forget the pool without closing it.
+
+        For forked worker processes: the inherited sockets belong to the
+        parent, so the child must neither use nor QUIT them.
+        """
+        cls._pool_lock = threading.Lock()
+        cls._pool = None
+
     @staticmethod
-    def send_email(subject, body, to_email=None):
+    def build_message(subject, body, to_email=None):
         if to_email is None:
-            to_email = Config.RECIPIENT_EMAIL
+            to_email = Config.MAIL_RECIPIENT
 
         msg = MIMEMultipart()
         msg['From'] = Config.MAIL_USERNAME
@@ -15,15 +62,40 @@ class EmailService:
         msg['Subject'] = subject
 
         msg.attach(MIMEText(body, 'plain'))
+        return msg
 
+    @staticmethod
+    def deliver(subject, body, to_email=None):
+        """Send an email over SMTP, raising on any delivery error"""
+        msg = EmailService.build_message(subject, body, to_email)
+        with timed('smtp'):
+            EmailService._send(msg)
+
+    @staticmethod
+    def _send(msg):
+        pool = EmailService.get_pool()
+        if pool is not None:
+            pool.sendmail(Config.MAIL_USERNAME, msg['To'], msg.as_string())
+            return
+
+        server = smtplib.SMTP(Config.MAIL_SERVER, Config.MAIL_PORT, timeout=Config.SMTP_TIMEOUT)
+        try:
+            if Config.MAIL_USE_TLS:
+                server.starttls()
+            if Config.MAIL_USERNAME:
+                server.login(Config.MAIL_USERNAME, Config.MAIL_PASSWORD)
+            server.sendmail(Config.MAIL_USERNAME, msg['To'], msg.as_string())
+        finally:
+            try:
+                server.quit()
+            except smtplib.SMTPException:
+                server.close()
+
+    @staticmethod
+    def send_email(subject, body, to_email=None):
         try:
-            server = smtplib.SMTP(Config.MAIL_SERVER, Config.MAIL_PORT)
-            server.starttls()
-            server.login(Config.MAIL_USERNAME, Config.MAIL_PASSWORD)
-            text = msg.as_string()
-            server.sendmail(Config.MAIL_USERNAME, to_email, text)
-            server.quit()
+            EmailService.deliver(subject, body, to_email)
             return True
         except Exception as e:
-            print(f"Error sending email: {str(e)}")
+            logger.error(f"Error sending email: {str(e)}")
             return False
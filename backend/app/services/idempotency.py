@@ -0,0 +1,59 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.idempotency_record import IdempotencyRecord
+from app.utils.validators import ValidationError
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyService:
+    """Remembers the response to a write so repeats can be answered from it.
+
+    A client-supplied Idempotency-Key identifies the write; without one the
+    payload fingerprint does, which catches double submits and blind
+    retries. Callers choose how long each kind of record is honoured.
+    Records are written in the caller's transaction, so a rolled back
+    write leaves none behind.
+    """
+
+    @staticmethod
+    def fingerprint(fields):
+        canonical = json.dumps(fields, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def record_key(scope, idempotency_key, fingerprint):
+        if idempotency_key is None:
+            return f'{scope}:content:{fingerprint}'
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            raise ValidationError(f'Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters')
+        return f'{scope}:key:{hashlib.sha256(idempotency_key.encode("utf-8")).hexdigest()}'
+
+    @staticmethod
+    def lookup(key, fingerprint, ttl):
+        """Return the stored (status code, response) for `key`, or None.
+
+        Expired records are deleted so the new write can take their key.
+        Reusing an Idempotency-Key for a different payload is an error.
+        """
+        record = IdempotencyRecord.query.filter_by(key=key).first()
+        if record is None:
+            return None
+        if record.created_at < datetime.utcnow() - timedelta(seconds=ttl):
+            db.session.delete(record)
+            db.session.flush()  # the replacement reuses the unique key
+            return None
+        if record.fingerprint != fingerprint:
+            raise ValidationError('Idempotency-Key was already used for a different request', 422)
+        return record.status_code, json.loads(record.response)
+
+    @staticmethod
+    def remember(key, fingerprint, status_code, response):
+        db.session.add(IdempotencyRecord(
+            key=key,
+            fingerprint=fingerprint,
+            status_code=status_code,
+            response=json.dumps(response, separators=(',', ':'))
+        ))
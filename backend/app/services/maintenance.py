@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from app.extensions import db, cache
+from app.models.idempotency_record import IdempotencyRecord
+from app.models.outbound_email import OutboundEmail
+from app.models.quote import Quote
+from app.models.review_stats import ReviewStats
+from app.services.review_stats_service import STATS_ID, ReviewStatsService
+
+DELETE_BATCH_SIZE = 1000
+
+
+def delete_in_batches(model, *criteria):
+    """Delete matching rows a batch at a time so no single transaction holds locks for long"""
+    deleted = 0
+    while True:
+        ids = [row_id for (row_id,) in
+               db.session.query(model.id).filter(*criteria).limit(DELETE_BATCH_SIZE).all()]
+        if not ids:
+            return deleted
+        deleted += model.query.filter(model.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+
+def purge_quotes(app):
+    """Delete quotes in QUOTE_PURGE_STATUSES created more than QUOTE_PURGE_AFTER_DAYS ago"""
+    days = app.config['QUOTE_PURGE_AFTER_DAYS']
+    statuses = app.config['QUOTE_PURGE_STATUSES']
+    if days <= 0 or not statuses:
+        return 'disabled'
+
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    deleted = delete_in_batches(Quote, Quote.status.in_(statuses), Quote.created_at < cutoff)
+    if deleted:
+        cache.invalidate('quotes')
+    return f'{deleted} quote(s) deleted'
+
+
+def purge_records(app):
+    """Delete expired idempotency records and delivered outbox emails"""
+    config = app.config
+    now = datetime.utcnow()
+
+    keep = max(config['IDEMPOTENCY_KEY_TTL'], config['QUOTE_DEDUP_WINDOW'])
+    records = delete_in_batches(IdempotencyRecord, IdempotencyRecord.created_at < now - timedelta(seconds=keep))
+
+    emails = 0
+    if config['EMAIL_PURGE_AFTER_DAYS'] > 0:
+        cutoff = now - timedelta(days=config['EMAIL_PURGE_AFTER_DAYS'])
+        emails = delete_in_batches(OutboundEmail, OutboundEmail.status.in_(['sent', 'digested']),
+                                   OutboundEmail.created_at < cutoff)
+    return f'{records} idempotency record(s), {emails} email(s) deleted'
+
+
+def rebuild_review_stats(app):
+    """Recompute the review aggregate in case a write ever bypassed ReviewStatsService"""
+    # Hold the aggregate row so concurrent review writes apply their deltas after the rebuild
+    ReviewStats.query.filter_by(id=STATS_ID).with_for_update().first()
+    stats = ReviewStatsService.rebuild()
+    db.session.commit()
+    cache.invalidate('reviews')
+    return f'{stats.review_count} review(s)'
+
+
+def retry_failed_emails(app):
+    """Give emails that exhausted their attempts another round, for EMAIL_RETRY_FAILED_WITHIN seconds"""
+    cutoff = datetime.utcnow() - timedelta(seconds=app.config['EMAIL_RETRY_FAILED_WITHIN'])
+    requeued = OutboundEmail.query.filter(
+        OutboundEmail.status == 'failed',
+        OutboundEmail.created_at >= cutoff
+    ).update({
+        'status': 'pending',
+        'attempts': 0,
+        'next_attempt_at': datetime.utcnow()
+    }, synchronize_session=False)
+    db.session.commit()
+    return f'{requeued} email(s) requeued'
+
+
+def analyze_database(app):
+    """Refresh the query planner's statistics"""
+    if db.engine.dialect.name == 'sqlite':
+        # Only analyzes tables whose statistics are stale
+        statement = 'PRAGMA optimize'
+    else:
+        statement = 'ANALYZE'
+    with db.engine.connect() as connection:
+        connection.execute(text(statement))
+        connection.commit()
+    return statement
+
+
+def vacuum_database(app):
+    """Rebuild the SQLite file to reclaim space left by deletes (PostgreSQL autovacuums)"""
+    if db.engine.dialect.name != 'sqlite':
+        return 'skipped: not SQLite'
+    # VACUUM cannot run inside a transaction
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.execute(text('VACUUM'))
+    return 'VACUUM'
+
+
+def register_maintenance_jobs(scheduler, config):
+    scheduler.register('purge_quotes', purge_quotes, config['JOB_PURGE_QUOTES_INTERVAL'])
+    scheduler.register('purge_records', purge_records, config['JOB_PURGE_RECORDS_INTERVAL'])
+    scheduler.register('retry_failed_emails', retry_failed_emails, config['JOB_RETRY_FAILED_EMAILS_INTERVAL'])
+    scheduler.register('rebuild_review_stats', rebuild_review_stats, config['JOB_REBUILD_REVIEW_STATS_INTERVAL'])
+    scheduler.register('analyze_database', analyze_database, config['JOB_ANALYZE_INTERVAL'])
+    scheduler.register('vacuum_database', vacuum_database, config['JOB_VACUUM_INTERVAL'])
@@ -0,0 +1,75 @@
+import threading
+from werkzeug.security import check_password_hash, generate_password_hash
+from app.instrumentation import timed
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when no hashing slot frees up within PASSWORD_HASH_WAIT_TIMEOUT"""
+
+    def __init__(self, retry_after=1):
+        super().__init__('Server is busy, please retry shortly')
+        self.retry_after = retry_after
+
+
+class PasswordHasher:
+    """Password hashing with configurable parameters and bounded concurrency.
+
+    Hashing is deliberately CPU-expensive. At most PASSWORD_HASH_CONCURRENCY
+    hashes run at once per process; other callers wait up to
+    PASSWORD_HASH_WAIT_TIMEOUT seconds for a slot and then get
+    PasswordHasherBusy, so a login burst queues up (or is shed) instead of
+    pinning every worker thread and starving cheap endpoints.
+    """
+
+    def __init__(self, method='scrypt:32768:8:1', salt_length=16, concurrency=2, wait_timeout=5.0):
+        self.configure(method, salt_length, concurrency, wait_timeout)
+
+    def configure(self, method, salt_length, concurrency, wait_timeout):
+        self.method = self.expand_method(method)
+        self.salt_length = salt_length
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max(concurrency, 1))
+
+    @staticmethod
+    def expand_method(method):
+        """The method as werkzeug records it in hashes, e.g. 'scrypt' -> 'scrypt:32768:8:1'.
+
+        Shorthand values would otherwise never match a stored hash and every
+        login would rehash. Also rejects unknown methods at startup.
+        """
+        return generate_password_hash('', method=method, salt_length=1).split('$', 1)[0]
+
+    def init_app(self, app):
+        self.configure(
+            app.config['PASSWORD_HASH_METHOD'],
+            app.config['PASSWORD_SALT_LENGTH'],
+            app.config['PASSWORD_HASH_CONCURRENCY'],
+            app.config['PASSWORD_HASH_WAIT_TIMEOUT']
+        )
+
+    def _run(self, fn, *args, **kwargs):
+        if not self._slots.acquire(timeout=self.wait_timeout):
+            raise PasswordHasherBusy(retry_after=max(int(self.wait_timeout), 1))
+        try:
+            with timed('hash'):
+                return fn(*args, **kwargs)
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, method=self.method, salt_length=self.salt_length)
+
+    def verify(self, password_hash, password):
+        if not password_hash:
+            return False
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True when a stored hash was made with different parameters than the current ones"""
+        if not password_hash or '$' not in password_hash:
+            return True
+        method, salt, _ = password_hash.split('$', 2)
+        return method != self.method or len(salt) != self.salt_length
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,206 @@
+import re
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import and_, column, func, literal_column, or_, select, table, text
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db, cache, events
+from app.models.quote import Quote
+from app.services.email_queue import EmailQueue
+from app.services.idempotency import IdempotencyService
+from app.utils.pagination import PaginationError, decode_cursor, encode_cursor, keyset_after
+from app.utils.validators import QUOTE_SCHEMA
+
+SEARCH_TERM = re.compile(r'\w+')
+MAX_SEARCH_TERMS = 8
+QUOTES_FTS = table('quotes_fts', column('rowid'))
+# bm25 column weights: name, email, service_type, project_details
+SQLITE_RANK = literal_column('bm25(quotes_fts, 10.0, 10.0, 4.0, 1.0)')
+SEARCH_VECTOR = literal_column('quotes.search_vector')
+
+NOTIFICATION_TEMPLATE = """
+        New Quote Request:
+
+        Name: {name}
+        Email: {email}
+        Phone: {phone}
+        Service Type: {service_type}
+        Project Details: {project_details}
+        Preferred Contact: {preferred_contact_method}
+        Budget Range: {budget_range}
+        Timeline: {timeline}
+        """
+
+
+class QuoteService:
+    """Quote creation and listing shared by every quote endpoint"""
+
+    @staticmethod
+    def create(data, idempotency_key=None):
+        """Validate a payload, store the quote and queue its notification.
+
+        Returns (quote dict, replayed). A repeat of an earlier submission,
+        matched by `idempotency_key` or, without one, by identical content
+        within QUOTE_DEDUP_WINDOW seconds, returns the original quote and
+        writes nothing. Raises ValidationError for a bad payload; the email
+        is queued in the same transaction as the quote and delivered by the
+        email worker. New quotes are published on the 'quotes' event stream.
+        """
+        fields = QUOTE_SCHEMA.load(data)
+
+        config = current_app.config
+        ttl = config['QUOTE_DEDUP_WINDOW'] if idempotency_key is None else config['IDEMPOTENCY_KEY_TTL']
+        if ttl > 0:
+            fingerprint = IdempotencyService.fingerprint(fields)
+            record_key = IdempotencyService.record_key('quotes', idempotency_key, fingerprint)
+            previous = IdempotencyService.lookup(record_key, fingerprint, ttl)
+            if previous is not None:
+                return previous[1], True
+
+        quote = Quote(**fields)
+        db.session.add(quote)
+
+        digest_key = 'quotes' if config['QUOTE_DIGEST_ENABLED'] else None
+        EmailQueue.enqueue('New Quote Request', QuoteService.notification_body(fields), digest_key=digest_key)
+
+        db.session.flush()
+        quote_data = quote.to_dict()
+        if ttl > 0:
+            IdempotencyService.remember(record_key, fingerprint, 201, quote_data)
+
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent duplicate committed first: answer with its quote
+            db.session.rollback()
+            previous = IdempotencyService.lookup(record_key, fingerprint, ttl) if ttl > 0 else None
+            if previous is None:
+                raise
+            return previous[1], True
+
+        cache.invalidate('quotes')
+        events.publish('quotes', 'quote.created', quote_data)
+        return quote_data, False
+
+    @staticmethod
+    def notification_body(fields):
+        return NOTIFICATION_TEMPLATE.format(**{
+            **fields,
+            'budget_range': fields['budget_range'] or 'Not specified',
+            'timeline': fields['timeline'] or 'Not specified'
+        })
+
+    @staticmethod
+    def list_page(limit, cursor=None, status=None, service_type=None,
+                  created_after=None, created_before=None):
+        """One keyset page of listing rows, newest first. Returns (rows, next_cursor or None).
+
+        Rows are plain column tuples rather than ORM objects; serialize them
+        with `serialize()`.
+        """
+        query = db.session.query(*Quote.listing_columns())
+        if status:
+            query = query.filter(Quote.status == status)
+        if service_type:
+            query = query.filter(Quote.service_type == service_type)
+        if created_after:
+            query = query.filter(Quote.created_at >= created_after)
+        if created_before:
+            query = query.filter(Quote.created_at < created_before)
+        if cursor:
+            query = query.filter(keyset_after((Quote.created_at, Quote.id),
+                                              decode_cursor(cursor, datetime, int)))
+
+        # Fetch one extra row to know whether there is a next page
+        rows = query.order_by(Quote.created_at.desc(), Quote.id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+        return rows, next_cursor
+
+    @staticmethod
+    def serialize(rows):
+        return [Quote.row_to_dict(row) for row in rows]
+
+    @staticmethod
+    def postgres_tsquery(terms):
+        """AND of the terms, each matching its 'simple' form (names, emails)
+        or its stemmed 'english' form (descriptions); the last one as a prefix"""
+        query = None
+        for i, term in enumerate(terms):
+            word = term + ':*' if i == len(terms) - 1 else term
+            either = func.to_tsquery('simple', word).op('||')(func.to_tsquery('english', word))
+            query = either if query is None else query.op('&&')(either)
+        return query
+
+    @staticmethod
+    def search(q, limit, cursor=None, status=None):
+        """Ranked full-text search over name, email, service type and project details.
+
+        Every word must match; the last one also matches as a prefix, so
+        results follow what is being typed ('jane roo' finds Jane's roofing
+        quote). The newest SEARCH_RANK_WINDOW matches come first, best match
+        first, which keeps very common words from scoring the whole table;
+        older matches follow newest first, so paging reaches every match.
+        Returns (rows, next_cursor or None).
+        """
+        terms = SEARCH_TERM.findall(q or '')[:MAX_SEARCH_TERMS]
+        if not terms:
+            raise PaginationError('q must contain at least one word')
+        offset = decode_cursor(cursor, int)[0] if cursor else 0
+        window = current_app.config['SEARCH_RANK_WINDOW']
+        listing = db.session.query(*Quote.listing_columns())
+
+        dialect = db.engine.dialect.name
+        if dialect == 'sqlite':
+            # FTS5 query syntax: quoted words are ANDed, "word"* is a prefix match
+            match = ' '.join(f'"{term}"' for term in terms) + '*'
+            match_id = QUOTES_FTS.c.rowid
+            matches = select(match_id.label('id')).join(Quote, Quote.id == match_id).where(
+                text('quotes_fts MATCH :match').bindparams(match=match))
+            if status:
+                matches = matches.where(Quote.status == status)
+            scored = matches.add_columns(SQLITE_RANK.label('score'))
+            lower_is_better = True  # bm25
+        elif dialect == 'postgresql':
+            tsquery = QuoteService.postgres_tsquery(terms)
+            match_id = Quote.id
+            matches = select(match_id.label('id')).where(SEARCH_VECTOR.op('@@')(tsquery))
+            if status:
+                matches = matches.where(Quote.status == status)
+            scored = matches.add_columns(func.ts_rank_cd(SEARCH_VECTOR, tsquery).label('score'))
+            lower_is_better = False  # ts_rank_cd
+        else:
+            # No full-text index on this backend: unranked substring matching
+            fields = (Quote.name, Quote.email, Quote.service_type, Quote.project_details)
+            query = listing.filter(and_(*[
+                or_(*[field.ilike(f'%{term}%') for field in fields]) for term in terms
+            ]))
+            if status:
+                query = query.filter(Quote.status == status)
+            rows = query.order_by(Quote.created_at.desc(), Quote.id.desc()).limit(limit + 1).offset(offset).all()
+            return QuoteService._search_page(rows, limit, offset)
+
+        # "Newest" as everywhere else: by created_at, which imported quotes may not share with id order
+        newest_first = (Quote.created_at.desc(), Quote.id.desc())
+        rows = []
+        if offset < window:
+            ranked = scored.order_by(*newest_first).limit(window).subquery()
+            rows = listing.select_from(ranked).join(Quote, Quote.id == ranked.c.id).order_by(
+                ranked.c.score if lower_is_better else ranked.c.score.desc(), *newest_first
+            ).limit(limit + 1).offset(offset).all()
+
+        if len(rows) <= limit and offset + len(rows) >= window:
+            # The ranked window is full and used up: continue with older matches
+            older = matches.order_by(*newest_first).offset(max(offset, window)).limit(
+                limit + 1 - len(rows)).subquery()
+            rows += listing.select_from(older).join(Quote, Quote.id == older.c.id).order_by(*newest_first).all()
+        return QuoteService._search_page(rows, limit, offset)
+
+    @staticmethod
+    def _search_page(rows, limit, offset):
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(offset + limit)
+        return rows, next_cursor
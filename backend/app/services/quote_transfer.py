@@ -0,0 +1,187 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from sqlalchemy import select
+from app.extensions import db
+from app.models.quote import Quote
+from app.utils.validators import QUOTE_IMPORT_SCHEMA, ValidationError
+
+EXPORT_FIELDS = [
+    'id', 'name', 'email', 'phone', 'service_type', 'project_details',
+    'preferred_contact_method', 'budget_range', 'timeline', 'status',
+    'created_at', 'updated_at'
+]
+DATETIME_FIELDS = ('created_at', 'updated_at')
+
+
+class QuoteImportError(ValueError):
+    def __init__(self, line_number, message):
+        super().__init__(f'line {line_number}: {message}')
+        self.line_number = line_number
+
+
+def iter_quote_rows(batch_size=1000, status=None):
+    """Yield quotes as plain dicts in id order without hydrating ORM objects.
+
+    Rows are fetched `batch_size` at a time (server-side cursor where the
+    driver supports it), so memory stays flat regardless of table size.
+    """
+    columns = [getattr(Quote, field) for field in EXPORT_FIELDS]
+    query = select(*columns).order_by(Quote.id)
+    if status:
+        query = query.where(Quote.status == status)
+
+    result = db.session.execute(query.execution_options(yield_per=batch_size, stream_results=True))
+    for row in result:
+        record = dict(zip(EXPORT_FIELDS, row))
+        for field in DATETIME_FIELDS:
+            if record[field] is not None:
+                record[field] = record[field].isoformat()
+        yield record
+
+
+def iter_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, separators=(',', ':')) + '\n'
+
+
+def iter_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        # Hand back whatever the writer produced and reuse the buffer
+        if buffer.tell() > 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining
+
+
+def iter_buffered(chunks, size=64 * 1024):
+    """Coalesce small chunks into writes of roughly `size` characters"""
+    buffer = []
+    buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield ''.join(buffer)
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_gzip(chunks, level=6):
+    """Gzip-compress a stream of text chunks incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def read_ndjson(stream):
+    """Yield (line number, record) from an NDJSON text stream.
+
+    A line that is not a JSON object is yielded as a QuoteImportError in
+    place of the record, so the importer can skip it like any other
+    invalid record.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, QuoteImportError(line_number, f'invalid JSON ({e})')
+            continue
+        if not isinstance(record, dict):
+            yield line_number, QuoteImportError(line_number, 'expected a JSON object')
+            continue
+        yield line_number, record
+
+
+def read_csv(stream):
+    """Yield (line number, record) from a CSV text stream with a header row"""
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def to_mapping(line_number, record, keep_ids=False, now=None):
+    """Validate one imported record and turn it into a full insert mapping.
+
+    Fields go through the same checks as quotes submitted to the API
+    (required fields, lengths, email and phone normalization).
+    """
+    now = now or datetime.utcnow()
+    try:
+        mapping = QUOTE_IMPORT_SCHEMA.load(record)
+    except ValidationError as e:
+        raise QuoteImportError(line_number, e.message)
+
+    for field in DATETIME_FIELDS:
+        value = record.get(field)
+        if value:
+            try:
+                mapping[field] = datetime.fromisoformat(str(value).replace('Z', '+00:00')).replace(tzinfo=None)
+            except ValueError:
+                raise QuoteImportError(line_number, f'{field} is not an ISO 8601 datetime')
+        else:
+            mapping[field] = now
+
+    if keep_ids and record.get('id'):
+        try:
+            mapping['id'] = int(record['id'])
+        except (TypeError, ValueError):
+            raise QuoteImportError(line_number, 'id must be an integer')
+    return mapping
+
+
+def import_quotes(records, batch_size=1000, keep_ids=False, strict=False, on_error=None):
+    """Insert (line number, record) pairs in chunks with bulk_insert_mappings.
+
+    Each chunk is committed on its own, so memory stays bounded. Invalid
+    records are skipped and reported through `on_error` unless `strict`, in
+    which case the first one aborts the import (chunks already committed
+    stay). Returns (imported, skipped).
+    """
+    imported = skipped = 0
+    chunk = []
+    now = datetime.utcnow()
+
+    def flush():
+        db.session.bulk_insert_mappings(Quote, chunk)
+        db.session.commit()
+        chunk.clear()
+
+    for line_number, record in records:
+        try:
+            if isinstance(record, QuoteImportError):
+                raise record
+            mapping = to_mapping(line_number, record, keep_ids=keep_ids, now=now)
+        except QuoteImportError as e:
+            if strict:
+                raise
+            skipped += 1
+            if on_error is not None:
+                on_error(e)
+            continue
+
+        chunk.append(mapping)
+        imported += 1
+        if len(chunk) >= batch_size:
+            flush()
+
+    if chunk:
+        flush()
+    return imported, skipped
@@ -0,0 +1,92 @@
+from datetime import datetime
+from app.extensions import db, cache
+from app.models.review import Review
+from app.models.user import User
+from app.services.review_stats_service import ReviewStatsService
+from app.services.user_cache import user_cache
+from app.utils.pagination import PaginationError, decode_cursor, encode_cursor, keyset_after
+from app.utils.validators import REVIEW_SCHEMA, REVIEW_UPDATE_SCHEMA, ValidationError
+
+REVIEW_SORTS = {
+    # sort name -> (keyset columns, cursor value types)
+    'newest': ((Review.created_at, Review.id), (datetime, int)),
+    'rating': ((Review.rating, Review.created_at, Review.id), (float, datetime, int)),
+}
+
+
+class ReviewPermissionError(PermissionError):
+    pass
+
+
+class ReviewService:
+    """Review writes and listings shared by every review endpoint.
+
+    Writes keep the ReviewStats aggregate in the same transaction and drop
+    cached review responses once committed.
+    """
+
+    @staticmethod
+    def create(user_id, data):
+        fields = REVIEW_SCHEMA.load(data)
+        if not user_cache.get(user_id):
+            raise ValidationError('User not found', 422)
+
+        review = Review(user_id=user_id, **fields)
+        db.session.add(review)
+        ReviewStatsService.record_created(review.rating)
+        db.session.commit()
+        cache.invalidate('reviews')
+        return review
+
+    @staticmethod
+    def update(review, user_id, data):
+        """Apply the title/content/rating present in `data`; only the author may edit"""
+        if review.user_id != user_id:
+            raise ReviewPermissionError('Unauthorized')
+
+        fields = REVIEW_UPDATE_SCHEMA.load(data, partial=True)
+        old_rating = review.rating
+        for name, value in fields.items():
+            setattr(review, name, value)
+
+        if review.rating != old_rating:
+            ReviewStatsService.record_updated(old_rating, review.rating)
+        db.session.commit()
+        cache.invalidate('reviews')
+        return review
+
+    @staticmethod
+    def delete(review, user_id, is_admin=False):
+        if not (is_admin or review.user_id == user_id):
+            raise ReviewPermissionError(
+                'Unauthorized: You must be an admin or the review owner to delete this review'
+            )
+
+        db.session.delete(review)
+        ReviewStatsService.record_deleted(review.rating)
+        db.session.commit()
+        cache.invalidate('reviews')
+
+    @staticmethod
+    def list_page(limit, cursor=None, sort='newest'):
+        """One keyset page of listing rows. Returns (rows, next_cursor or None)."""
+        if sort not in REVIEW_SORTS:
+            raise PaginationError(f'sort must be one of: {", ".join(REVIEW_SORTS)}')
+        columns, cursor_types = REVIEW_SORTS[sort]
+
+        # Only the listed columns plus the author's username, in one query
+        query = db.session.query(*Review.listing_columns()).outerjoin(User, Review.user_id == User.id)
+        if cursor:
+            query = query.filter(keyset_after(columns, decode_cursor(cursor, *cursor_types)))
+
+        # Fetch one extra row to know whether there is a next page
+        rows = query.order_by(*[column.desc() for column in columns]).limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(*[getattr(rows[-1], column.key) for column in columns])
+        return rows, next_cursor
+
+    @staticmethod
+    def serialize(rows):
+        return [Review.row_to_dict(row) for row in rows]
@@ -0,0 +1,93 @@
+from datetime import datetime
+from sqlalchemy import case, func
+from app.extensions import db
+from app.models.review import Review
+from app.models.review_stats import ReviewStats
+
+STATS_ID = 1
+
+class ReviewStatsService:
+    """Keeps the ReviewStats row in step with review writes.
+
+    Each write applies a relative UPDATE in the caller's transaction, so the
+    aggregate commits (or rolls back) together with the review itself and
+    concurrent writers cannot lose increments.
+    """
+
+    @staticmethod
+    def _apply(changes):
+        changes = {column: delta for column, delta in changes.items() if delta}
+        if not changes:
+            return
+
+        values = {getattr(ReviewStats, column): getattr(ReviewStats, column) + delta
+                  for column, delta in changes.items()}
+        values[ReviewStats.updated_at] = datetime.utcnow()
+        updated = ReviewStats.query.filter_by(id=STATS_ID).update(values, synchronize_session=False)
+        if not updated:
+            # No aggregate yet: build it from the reviews table, which already
+            # includes the pending change thanks to the flush
+            db.session.flush()
+            ReviewStatsService.rebuild()
+
+    @staticmethod
+    def record_created(rating):
+        ReviewStatsService._apply({
+            'review_count': 1,
+            'rating_sum': rating,
+            ReviewStats.bucket_column(rating): 1
+        })
+
+    @staticmethod
+    def record_deleted(rating):
+        ReviewStatsService._apply({
+            'review_count': -1,
+            'rating_sum': -rating,
+            ReviewStats.bucket_column(rating): -1
+        })
+
+    @staticmethod
+    def record_updated(old_rating, new_rating):
+        changes = {'rating_sum': new_rating - old_rating}
+        old_column = ReviewStats.bucket_column(old_rating)
+        new_column = ReviewStats.bucket_column(new_rating)
+        if old_column != new_column:
+            changes[old_column] = -1
+            changes[new_column] = 1
+        ReviewStatsService._apply(changes)
+
+    @staticmethod
+    def rebuild():
+        """Recompute the aggregate from scratch. The caller commits."""
+        buckets = [
+            func.coalesce(func.sum(case((Review.rating < 1.5, 1), else_=0)), 0),
+            func.coalesce(func.sum(case(((Review.rating >= 1.5) & (Review.rating < 2.5), 1), else_=0)), 0),
+            func.coalesce(func.sum(case(((Review.rating >= 2.5) & (Review.rating < 3.5), 1), else_=0)), 0),
+            func.coalesce(func.sum(case(((Review.rating >= 3.5) & (Review.rating < 4.5), 1), else_=0)), 0),
+            func.coalesce(func.sum(case((Review.rating >= 4.5, 1), else_=0)), 0),
+        ]
+        row = db.session.query(
+            func.count(Review.id),
+            func.coalesce(func.sum(Review.rating), 0),
+            *buckets
+        ).one()
+
+        stats = db.session.get(ReviewStats, STATS_ID)
+        if stats is None:
+            stats = ReviewStats(id=STATS_ID)
+            db.session.add(stats)
+
+        stats.review_count = row[0]
+        stats.rating_sum = float(row[1])
+        for star, total in enumerate(row[2:], start=1):
+            setattr(stats, f'rating_{star}', total)
+        stats.updated_at = datetime.utcnow()
+        return stats
+
+    @staticmethod
+    def get():
+        stats = db.session.get(ReviewStats, STATS_ID)
+        if stats is None:
+            stats = ReviewStatsService.rebuild()
+            db.session.commit()
+        return stats
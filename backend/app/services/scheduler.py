@@ -0,0 +1,97 @@
+import threading
+import time
+from app.extensions import db
+from app.instrumentation import metrics
+
+JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+metrics.describe('job_duration_seconds', 'Wall time of one scheduled job run', JOB_BUCKETS)
+metrics.describe('job_runs_total', 'Scheduled job runs, by job and outcome')
+
+
+class Job:
+    __slots__ = ('name', 'func', 'interval', 'next_run')
+
+    def __init__(self, name, func, interval):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.next_run = None  # monotonic time, set once the scheduler sees the job
+
+
+class JobScheduler:
+    """Runs maintenance jobs at fixed intervals, one at a time, off the request path.
+
+    Jobs are plain functions taking the app; each run gets its own app
+    context and session. A job whose interval is 0 is registered but never
+    scheduled (it can still be run by name). Every job first runs
+    `startup_delay` seconds after the scheduler starts.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.poll_interval = app.config['SCHEDULER_POLL_INTERVAL']
+        self.startup_delay = app.config['SCHEDULER_STARTUP_DELAY']
+        self.jobs = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def register(self, name, func, interval):
+        self.jobs[name] = Job(name, func, interval)
+        return func
+
+    def run_job(self, name):
+        """Run one job now. Returns True if it succeeded."""
+        job = self.jobs[name]
+        started = time.perf_counter()
+        try:
+            with self.app.app_context():
+                try:
+                    result = job.func(self.app)
+                except Exception:
+                    db.session.rollback()
+                    raise
+            outcome = 'success'
+            self.app.logger.info(f"Job {name} finished in {time.perf_counter() - started:.2f}s: {result}")
+        except Exception as e:
+            outcome = 'error'
+            self.app.logger.exception(f"Job {name} failed: {str(e)}")
+
+        metrics.observe('job_duration_seconds', time.perf_counter() - started, job=name)
+        metrics.increment('job_runs_total', job=name, outcome=outcome)
+        return outcome == 'success'
+
+    def run_all(self):
+        """Run every enabled job once, in registration order. Returns the names of failed jobs."""
+        return [name for name, job in self.jobs.items() if job.interval > 0 and not self.run_job(name)]
+
+    def run_pending(self):
+        now = time.monotonic()
+        for job in self.jobs.values():
+            if job.interval <= 0:
+                continue
+            if job.next_run is None:
+                job.next_run = now + min(self.startup_delay, job.interval)
+            if job.next_run <= now:
+                self.run_job(job.name)
+                # Schedule from the end of the run so a slow job never piles up
+                job.next_run = time.monotonic() + job.interval
+            if self._stop.is_set():
+                break
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name='job-scheduler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,120 @@
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+
+class SMTPConnectionPool:
+    """A small pool of authenticated SMTP sessions.
+
+    Reusing sessions saves the TCP connect, STARTTLS handshake and AUTH exchange
+    on every message. Idle sessions are closed after `idle_timeout` seconds,
+    sessions idle longer than `noop_after` seconds are health-checked with NOOP
+    before reuse, and a send that hits a dropped session is retried once on a
+    fresh connection.
+    """
+
+    def __init__(self, host, port, username=None, password=None, use_tls=True,
+                 size=4, idle_timeout=60, noop_after=10, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.noop_after = noop_after
+        self.timeout = timeout
+
+        self._idle = []  # (connection, last_used) pairs, most recently used last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self):
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            self._close(server)
+            raise
+        return server
+
+    @staticmethod
+    def _close(server):
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    @staticmethod
+    def _is_alive(server):
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _checkout(self):
+        """Return a live idle session if there is one, otherwise open a new one"""
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, last_used = self._idle.pop()
+
+            idle_for = now - last_used
+            if idle_for > self.idle_timeout:
+                self._close(server)
+                continue
+            if idle_for > self.noop_after and not self._is_alive(server):
+                server.close()
+                continue
+            return server
+
+        return self._connect()
+
+    def _checkin(self, server):
+        with self._lock:
+            self._idle.append((server, time.monotonic()))
+
+    @contextmanager
+    def connection(self):
+        """Borrow a session; it is returned to the pool unless the block raised"""
+        self._slots.acquire()
+        try:
+            server = self._checkout()
+            try:
+                yield server
+            except Exception:
+                server.close()
+                raise
+            self._checkin(server)
+        finally:
+            self._slots.release()
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        try:
+            with self.connection() as server:
+                return server.sendmail(from_addr, to_addrs, msg)
+        except smtplib.SMTPServerDisconnected:
+            # The pooled session was dropped by the server; retry on a new one
+            with self.connection() as server:
+                return server.sendmail(from_addr, to_addrs, msg)
+
+    def prune(self):
+        """Close sessions that have been idle longer than the idle timeout"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [server for server, last_used in self._idle if now - last_used > self.idle_timeout]
+            self._idle = [(server, last_used) for server, last_used in self._idle
+                          if now - last_used <= self.idle_timeout]
+        for server in expired:
+            self._close(server)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._close(server)
@@ -0,0 +1,54 @@
+import threading
+import time
+from app.extensions import db
+from app.models.user import User
+
+class UserCache:
+    """Per-process TTL cache of the few user fields needed for authorization.
+
+    Entries are plain dicts (id, is_admin, token_version), never ORM objects,
+    so they are safe to share across requests and threads. A change made in
+    another process is picked up once the entry expires.
+    """
+
+    def __init__(self, ttl=60, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        """Return the cached snapshot for a user, loading it on a miss; None if the user does not exist"""
+        user_id = int(user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        row = db.session.query(User.id, User.is_admin, User.token_version).filter(User.id == user_id).first()
+        snapshot = None
+        if row is not None:
+            snapshot = {
+                'id': row.id,
+                'is_admin': bool(row.is_admin),
+                'token_version': row.token_version or 0
+            }
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries = {key: value for key, value in self._entries.items() if value[0] > now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[user_id] = (now + self.ttl, snapshot)
+        return snapshot
+
+    def invalidate(self, user_id=None):
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(int(user_id), None)
+
+
+user_cache = UserCache()
@@ -0,0 +1,36 @@
+from flask_jwt_extended import create_access_token, get_jwt, get_jwt_identity
+from app.services.user_cache import user_cache
+
+
+def create_user_token(user):
+    """Issue an access token carrying the admin flag and the user's token version"""
+    return create_access_token(
+        identity=user.id,
+        additional_claims={
+            'is_admin': bool(user.is_admin),
+            'token_version': user.token_version or 0
+        }
+    )
+
+
+def current_user_is_admin():
+    """Read the admin flag from the token, falling back to the user cache for older tokens"""
+    claims = get_jwt()
+    if 'is_admin' in claims:
+        return bool(claims['is_admin'])
+    user = user_cache.get(get_jwt_identity())
+    return bool(user and user['is_admin'])
+
+
+def init_jwt_callbacks(app, jwt):
+    user_cache.ttl = app.config['USER_CACHE_TTL']
+
+    @jwt.token_in_blocklist_loader
+    def token_revoked(jwt_header, jwt_payload):
+        # A token is revoked when its user is gone or its version is stale
+        # (bumped by `flask revoke-tokens`). Served from the user cache, so
+        # revocation takes effect within USER_CACHE_TTL seconds.
+        user = user_cache.get(jwt_payload['sub'])
+        if user is None:
+            return True
+        return jwt_payload.get('token_version', 0) != user['token_version']
@@ -0,0 +1,198 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, make_response, request
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with a per-entry TTL.
+
+    Every worker process has its own copy, so an invalidation only reaches the
+    process that performed the write; other workers catch up when the TTL runs
+    out. Use the Redis backend when that staleness window is not acceptable.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self, namespace):
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def bump_generation(self, namespace):
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            # Old entries can never be hit again; drop them now instead of waiting for LRU eviction
+            prefix = f'{namespace}:'
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+
+class RedisCacheBackend:
+    """Shared cache for multi-worker deployments (requires the `redis` package).
+
+    Namespace generations live in Redis too, so an invalidation in one worker
+    is seen by all of them immediately.
+    """
+
+    def __init__(self, url, key_prefix='response-cache:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.key_prefix = key_prefix
+
+    def get(self, key):
+        fields = self.client.hgetall(self.key_prefix + key)
+        if not fields:
+            return None
+        return {
+            'body': fields[b'body'],
+            'status': int(fields[b'status']),
+            'mimetype': fields[b'mimetype'].decode(),
+            'etag': fields[b'etag'].decode()
+        }
+
+    def set(self, key, value, ttl):
+        redis_key = self.key_prefix + key
+        pipe = self.client.pipeline()
+        pipe.hset(redis_key, mapping={
+            'body': value['body'],
+            'status': value['status'],
+            'mimetype': value['mimetype'],
+            'etag': value['etag']
+        })
+        pipe.expire(redis_key, max(int(ttl), 1))
+        pipe.execute()
+
+    def generation(self, namespace):
+        value = self.client.get(f'{self.key_prefix}generation:{namespace}')
+        return int(value) if value else 0
+
+    def bump_generation(self, namespace):
+        self.client.incr(f'{self.key_prefix}generation:{namespace}')
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.key_prefix + '*'):
+            self.client.delete(key)
+
+
+class ResponseCache:
+    """Caches successful GET responses per namespace and query string.
+
+    Views opt in with `@cache.cached('reviews')`; writes call
+    `cache.invalidate('reviews')` after committing. Cached responses carry
+    an ETag, and a matching If-None-Match is answered with 304.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.enabled = False
+        self.default_ttl = 30
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config['RESPONSE_CACHE_ENABLED']
+        self.default_ttl = app.config['RESPONSE_CACHE_TTL']
+        if app.config['RESPONSE_CACHE_BACKEND'] == 'redis':
+            self.backend = RedisCacheBackend(app.config['RESPONSE_CACHE_REDIS_URL'])
+        else:
+            self.backend = MemoryCacheBackend(app.config['RESPONSE_CACHE_MAX_ENTRIES'])
+        app.extensions['response_cache'] = self
+
+    def make_key(self, namespace):
+        args = '&'.join(f'{key}={value}' for key, value in sorted(request.args.items(multi=True)))
+        generation = self.backend.generation(namespace)
+        return f'{namespace}:{generation}:{request.path}?{args}'
+
+    def invalidate(self, *namespaces):
+        if self.backend is None:
+            return
+        for namespace in namespaces:
+            try:
+                self.backend.bump_generation(namespace)
+            except Exception as e:
+                current_app.logger.warning(f"Cache invalidation failed for {namespace}: {str(e)}")
+
+    @staticmethod
+    def _not_modified(entry):
+        if_none_match = request.if_none_match
+        return if_none_match and entry['etag'] in if_none_match
+
+    @staticmethod
+    def _respond(entry):
+        if ResponseCache._not_modified(entry):
+            response = make_response('', 304)
+        else:
+            response = make_response(entry['body'], entry['status'])
+            response.mimetype = entry['mimetype']
+        response.set_etag(entry['etag'])
+        return response
+
+    def cached(self, namespace, ttl=None):
+        def wrapper(fn):
+            @wraps(fn)
+            def decorated_function(*args, **kwargs):
+                if not self.enabled or request.method != 'GET':
+                    return fn(*args, **kwargs)
+
+                try:
+                    key = self.make_key(namespace)
+                    entry = self.backend.get(key)
+                except Exception as e:
+                    # A broken cache must never take the endpoint down with it
+                    current_app.logger.warning(f"Cache lookup failed: {str(e)}")
+                    return fn(*args, **kwargs)
+
+                if entry is not None:
+                    return self._respond(entry)
+
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+
+                body = response.get_data()
+                entry = {
+                    'body': body,
+                    'status': response.status_code,
+                    'mimetype': response.mimetype,
+                    'etag': hashlib.sha1(body).hexdigest()
+                }
+                try:
+                    self.backend.set(key, entry, ttl or self.default_ttl)
+                except Exception as e:
+                    current_app.logger.warning(f"Cache store failed: {str(e)}")
+                return self._respond(entry)
+            return decorated_function
+        return wrapper
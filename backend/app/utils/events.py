@@ -0,0 +1,199 @@
+import threading
+import time
+import uuid
+from collections import deque
+from flask import current_app
+
+
+class MemoryEventBackend:
+    """Recent events per channel, held in this process.
+
+    Subscribers only see events published by the same worker process. Ids
+    are '<epoch>-<sequence>' with an epoch unique to the process, so an id
+    from another worker or from before a restart always leads to a reset.
+    Use the Redis backend when more than one worker serves the API.
+    """
+
+    def __init__(self, buffer_size=1000):
+        self.buffer_size = buffer_size
+        self.reset()
+
+    def reset(self):
+        """Start a new epoch with empty buffers (also used after fork)"""
+        self.epoch = uuid.uuid4().hex[:12]
+        self._channels = {}  # channel -> deque of (sequence, event, data)
+        self._last_ids = {}
+        self._changed = threading.Condition()
+
+    def publish(self, channel, event, data):
+        with self._changed:
+            event_id = self._last_ids.get(channel, 0) + 1
+            self._last_ids[channel] = event_id
+            buffer = self._channels.setdefault(channel, deque(maxlen=self.buffer_size))
+            buffer.append((event_id, event, data))
+            self._changed.notify_all()
+        return f'{self.epoch}-{event_id}'
+
+    def latest_id(self, channel):
+        with self._changed:
+            return f'{self.epoch}-{self._last_ids.get(channel, 0)}'
+
+    def _since(self, channel, last_id):
+        last = self._last_ids.get(channel, 0)
+        buffer = self._channels.get(channel, ())
+        # Ids this process never issued, or older than the buffer, cannot be resumed
+        if last_id > last or (buffer and last_id < buffer[0][0] - 1):
+            return None
+        return [(f'{self.epoch}-{event_id}', event, data)
+                for event_id, event, data in buffer if event_id > last_id]
+
+    def read(self, channel, last_id, timeout):
+        """Events after `last_id`, waiting up to `timeout` seconds for one.
+
+        Returns None when `last_id` can no longer be resumed from.
+        """
+        try:
+            epoch, sequence = last_id.split('-')
+            last_id = int(sequence)
+        except (AttributeError, ValueError):
+            return None
+        if epoch != self.epoch:
+            return None
+        with self._changed:
+            events = self._since(channel, last_id)
+            if events == []:
+                self._changed.wait(timeout)
+                events = self._since(channel, last_id)
+            return events
+
+
+class RedisEventBackend:
+    """Events in a Redis stream per channel, shared by every worker (requires the `redis` package)"""
+
+    def __init__(self, url, buffer_size=1000, key_prefix='events:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("EVENTS_BACKEND=redis requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.buffer_size = buffer_size
+        self.key_prefix = key_prefix
+
+    def publish(self, channel, event, data):
+        event_id = self.client.xadd(self.key_prefix + channel, {'event': event, 'data': data},
+                                    maxlen=self.buffer_size, approximate=True)
+        return event_id.decode()
+
+    def latest_id(self, channel):
+        entries = self.client.xrevrange(self.key_prefix + channel, count=1)
+        return entries[0][0].decode() if entries else '0-0'
+
+    @staticmethod
+    def _parse_id(event_id):
+        try:
+            milliseconds, sequence = event_id.split('-')
+            return int(milliseconds), int(sequence)
+        except (AttributeError, ValueError):
+            return None
+
+    def read(self, channel, last_id, timeout):
+        """Events after `last_id`, waiting up to `timeout` seconds for one.
+
+        Returns None when `last_id` can no longer be resumed from.
+        """
+        key = self.key_prefix + channel
+        last = self._parse_id(last_id)
+        if last is None:
+            return None
+        if last != (0, 0):
+            # `last_id` was trimmed from the stream, and maybe events after it too
+            oldest = self.client.xrange(key, count=1)
+            if oldest and self._parse_id(oldest[0][0].decode()) > last:
+                return None
+
+        response = self.client.xread({key: last_id}, count=self.buffer_size, block=max(int(timeout * 1000), 1))
+        if not response:
+            return []
+        return [(event_id.decode(), fields[b'event'].decode(), fields[b'data'].decode())
+                for event_id, fields in response[0][1]]
+
+
+class EventBroker:
+    """Publish/subscribe for server-sent events.
+
+    Writers call `events.publish('quotes', 'quote.created', data)` after
+    committing; stream endpoints iterate `events.stream('quotes', last_id)`.
+    Recent events are kept so a reconnecting client can resume from its
+    Last-Event-ID.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.heartbeat_interval = 15
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.heartbeat_interval = app.config['SSE_HEARTBEAT_INTERVAL']
+        if app.config['EVENTS_BACKEND'] == 'redis':
+            self.backend = RedisEventBackend(app.config['EVENTS_REDIS_URL'], app.config['EVENTS_BUFFER_SIZE'])
+        else:
+            self.backend = MemoryEventBackend(app.config['EVENTS_BUFFER_SIZE'])
+        app.extensions['events'] = self
+
+    def after_fork(self):
+        # Each worker process needs its own epoch, buffers and lock
+        if isinstance(self.backend, MemoryEventBackend):
+            self.backend.reset()
+
+    def publish(self, channel, event, data):
+        """Publish `data` (JSON-encoded here). Failures are logged, never raised."""
+        if self.backend is None:
+            return None
+        try:
+            return self.backend.publish(channel, event, current_app.json.dumps(data))
+        except Exception as e:
+            current_app.logger.warning(f"Publishing {event} failed: {str(e)}")
+            return None
+
+    @staticmethod
+    def format(event, data, event_id=None):
+        lines = []
+        if event_id is not None:
+            lines.append(f'id: {event_id}')
+        lines.append(f'event: {event}')
+        lines.extend(f'data: {line}' for line in data.splitlines() or [''])
+        return '\n'.join(lines) + '\n\n'
+
+    def stream(self, channel, last_id=None, max_duration=None, retry=None):
+        """Yield server-sent event messages for `channel`.
+
+        Without `last_id` the stream starts at the newest event, announced
+        by a 'ready' event carrying its id. A `last_id` that is too old to
+        resume from yields a 'reset' event: the client should reload its
+        list. Comment lines keep idle connections open; the stream ends
+        after `max_duration` seconds and the client reconnects.
+        """
+        if retry:
+            yield f'retry: {int(retry)}\n\n'
+
+        if last_id is None or self.backend.read(channel, last_id, 0) is None:
+            event = 'ready' if last_id is None else 'reset'
+            last_id = self.backend.latest_id(channel)
+            yield self.format(event, '{}', last_id)
+
+        deadline = time.monotonic() + max_duration if max_duration else None
+        while deadline is None or time.monotonic() < deadline:
+            wait = self.heartbeat_interval
+            if deadline is not None:
+                wait = max(min(wait, deadline - time.monotonic()), 0)
+            events = self.backend.read(channel, last_id, wait)
+            if events is None:
+                last_id = self.backend.latest_id(channel)
+                yield self.format('reset', '{}', last_id)
+            elif events:
+                for event_id, event, data in events:
+                    yield self.format(event, data, event_id)
+                last_id = events[-1][0]
+            else:
+                yield ': keep-alive\n\n'
@@ -0,0 +1,128 @@
+import threading
+import time
+from flask import current_app
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_limit(value):
+    """Parse '10/minute' into (capacity, refill rate in tokens per second)"""
+    try:
+        count, period = value.split('/', 1)
+        count = int(count)
+        seconds = PERIODS[period.strip().lower().rstrip('s')]
+    except (ValueError, KeyError, AttributeError):
+        raise ValueError(f"Invalid rate limit '{value}', expected e.g. '10/minute'")
+    if count < 1:
+        raise ValueError(f"Invalid rate limit '{value}', count must be at least 1")
+    return count, count / seconds
+
+
+class MemoryRateLimitBackend:
+    """Token buckets held in this process. Each worker enforces its own limits."""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = {}  # key -> [tokens, last refill time, capacity, rate]
+        self._lock = threading.Lock()
+
+    def hit(self, key, capacity, rate):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._prune(now)
+                bucket = self._buckets[key] = [capacity, now, capacity, rate]
+
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return True, 0
+            bucket[0] = tokens
+            return False, (1 - tokens) / rate
+
+    def _prune(self, now):
+        # Buckets that have refilled completely carry no state worth keeping
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items()
+            if bucket[0] + (now - bucket[1]) * bucket[3] < bucket[2]
+        }
+        if len(self._buckets) >= self.max_keys:
+            self._buckets.clear()
+
+
+class RedisRateLimitBackend:
+    """Token buckets shared by every worker (requires the `redis` package)"""
+
+    SCRIPT = """
+        local capacity = tonumber(ARGV[1])
+        local rate = tonumber(ARGV[2])
+        local now = tonumber(ARGV[3])
+        local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+        local tokens = tonumber(bucket[1]) or capacity
+        local updated = tonumber(bucket[2]) or now
+        tokens = math.min(capacity, tokens + math.max(now - updated, 0) * rate)
+        local allowed = 0
+        local retry_after = 0
+        if tokens >= 1 then
+            tokens = tokens - 1
+            allowed = 1
+        else
+            retry_after = (1 - tokens) / rate
+        end
+        redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+        redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+        return {allowed, tostring(retry_after)}
+    """
+
+    def __init__(self, url, key_prefix='rate-limit:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.key_prefix = key_prefix
+        self._script = self.client.register_script(self.SCRIPT)
+
+    def hit(self, key, capacity, rate):
+        allowed, retry_after = self._script(keys=[self.key_prefix + key], args=[capacity, rate, time.time()])
+        return bool(allowed), float(retry_after)
+
+
+class RateLimiter:
+    """Checks token buckets; limits are named config values like '10/minute'"""
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.enabled = False
+        self._limits = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config['RATE_LIMIT_ENABLED']
+        if app.config['RATE_LIMIT_BACKEND'] == 'redis':
+            self.backend = RedisRateLimitBackend(app.config['RATE_LIMIT_REDIS_URL'])
+        else:
+            self.backend = MemoryRateLimitBackend()
+        app.extensions['rate_limiter'] = self
+
+    def limit_for(self, config_key):
+        value = current_app.config[config_key]
+        if value not in self._limits:
+            self._limits[value] = parse_limit(value)
+        return self._limits[value]
+
+    def hit(self, key, config_key):
+        """Take one token for `key`. Returns (allowed, seconds until a token is available)."""
+        if not self.enabled:
+            return True, 0
+        capacity, rate = self.limit_for(config_key)
+        try:
+            return self.backend.hit(f'{config_key}:{key}', capacity, rate)
+        except Exception as e:
+            # Fail open: an unavailable limiter store must not take the API down
+            current_app.logger.warning(f"Rate limiter unavailable: {str(e)}")
+            return True, 0
@@ -0,0 +1,189 @@
+import re
+from email_validator import EmailNotValidError, validate_email
+
+PHONE_SEPARATORS = re.compile(r'[\s().\-/]')
+PHONE_DIGITS = re.compile(r'\+?\d{7,15}')
+# Text columns have no size of their own; this keeps payloads (and emails) sane
+TEXT_MAX_LENGTH = 10000
+
+
+class ValidationError(ValueError):
+    """Invalid request payload; `status_code` is what the API answers with"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+class Field:
+    """One payload field.
+
+    `keys` are the JSON keys accepted for it, in order of preference (the
+    first is used in error messages). String fields are stripped (unless
+    `strip=False`), must not be blank when required and may not exceed
+    `max_length`. `check` may normalize the value or raise ValidationError.
+    """
+
+    __slots__ = ('name', 'keys', 'required', 'default', 'type', 'max_length', 'strip', 'check')
+
+    def __init__(self, name, keys=None, required=False, default=None, type=str, max_length=None,
+                 strip=True, check=None):
+        self.name = name
+        self.keys = tuple(keys or (name,))
+        self.required = required
+        self.default = default
+        self.type = type
+        self.max_length = max_length
+        self.strip = strip
+        self.check = check
+
+    def compile(self):
+        """Fold the type, length and custom checks into one function"""
+        label = self.keys[0]
+        expected, max_length, required, strip, check = (
+            self.type, self.max_length, self.required, self.strip, self.check
+        )
+
+        if expected is str:
+            def convert(value):
+                if not isinstance(value, str):
+                    raise ValidationError(f'{label} must be a string')
+                if strip:
+                    value = value.strip()
+                if not value:
+                    if required:
+                        raise ValidationError(f'{label} must not be blank')
+                    return None
+                if max_length is not None and len(value) > max_length:
+                    raise ValidationError(f'{label} must be at most {max_length} characters')
+                return check(value) if check is not None else value
+        elif expected is not None:
+            type_name = 'a number' if expected in (int, float, (int, float)) else f'a {expected.__name__}'
+
+            def convert(value):
+                # bool is an int subclass, but true/false is never a valid number here
+                if isinstance(value, bool) or not isinstance(value, expected):
+                    raise ValidationError(f'{label} must be {type_name}')
+                return check(value) if check is not None else value
+        else:
+            def convert(value):
+                return check(value) if check is not None else value
+        return convert
+
+
+class Schema:
+    """A declarative payload schema, compiled once at import time"""
+
+    def __init__(self, *fields, status_code=400):
+        self.status_code = status_code
+        self._fields = tuple((f.name, f.keys, f.required, f.default, f.compile()) for f in fields)
+
+    def load(self, data, partial=False):
+        """Return a dict keyed by field name; with `partial`, absent fields are left out"""
+        if not isinstance(data, dict) or not data:
+            raise ValidationError('No data provided', self.status_code)
+
+        result = {}
+        missing = []
+        for name, keys, required, default, convert in self._fields:
+            for key in keys:
+                if key in data:
+                    value = data[key]
+                    break
+            else:
+                if partial:
+                    continue
+                if required:
+                    missing.append(keys[0])
+                    continue
+                result[name] = default
+                continue
+
+            if value is None:
+                if required:
+                    missing.append(keys[0])
+                    continue
+                result[name] = default
+                continue
+
+            try:
+                value = convert(value)
+            except ValidationError as e:
+                raise ValidationError(e.message, self.status_code)
+            result[name] = default if value is None else value
+
+        if missing:
+            raise ValidationError(f'Missing required field(s): {", ".join(missing)}', self.status_code)
+        return result
+
+
+def normalize_email(value):
+    """Syntax check only (no DNS lookups); lowercases the domain"""
+    try:
+        return validate_email(value, check_deliverability=False).normalized
+    except EmailNotValidError as e:
+        raise ValidationError(f'Invalid email address: {e}')
+
+
+def normalize_phone(value):
+    """Drop separators like spaces, dots, dashes and parentheses; keep a leading +"""
+    phone = PHONE_SEPARATORS.sub('', value)
+    if not PHONE_DIGITS.fullmatch(phone):
+        raise ValidationError('Invalid phone number: expected 7 to 15 digits')
+    return phone
+
+
+def check_rating(value):
+    if not 1 <= value <= 5:
+        raise ValidationError(f'Invalid rating value: {value}. Must be between 1 and 5')
+    return value
+
+
+# Lengths follow the column sizes in app/models
+QUOTE_FIELDS = (
+    # The public API posts camelCase; snake_case is accepted too
+    Field('name', required=True, max_length=100),
+    Field('email', required=True, max_length=120, check=normalize_email),
+    Field('phone', required=True, max_length=20, check=normalize_phone),
+    Field('service_type', keys=('serviceType', 'service_type'), required=True, max_length=100),
+    Field('project_details', keys=('projectDetails', 'project_details'), required=True,
+          max_length=TEXT_MAX_LENGTH),
+    Field('preferred_contact_method', keys=('preferredContactMethod', 'preferred_contact_method'),
+          default='email', max_length=20),
+    Field('budget_range', keys=('budgetRange', 'budget_range'), max_length=50),
+    Field('timeline', max_length=100),
+)
+QUOTE_SCHEMA = Schema(*QUOTE_FIELDS)
+# Bulk imports (flask quotes import) may also carry the status
+QUOTE_IMPORT_SCHEMA = Schema(*QUOTE_FIELDS, Field('status', default='pending', max_length=20))
+
+REVIEW_FIELDS = (
+    Field('title', required=True, max_length=100),
+    Field('content', required=True, max_length=TEXT_MAX_LENGTH),
+    Field('rating', required=True, type=(int, float), check=check_rating),
+)
+REVIEW_SCHEMA = Schema(*REVIEW_FIELDS, status_code=422)
+REVIEW_UPDATE_SCHEMA = Schema(*REVIEW_FIELDS)
+
+REGISTER_SCHEMA = Schema(
+    Field('email', required=True, max_length=120, check=normalize_email),
+    Field('username', required=True, max_length=80),
+    Field('password', required=True, max_length=128, strip=False),
+)
+
+def login_emails(value):
+    """Addresses to look a login up by: the normalized form registration
+    stores, then the raw input for accounts created before normalization"""
+    try:
+        normalized = normalize_email(value)
+    except ValidationError:
+        return [value]
+    return [normalized] if normalized == value else [normalized, value]
+
+
+# Login only checks shape; the email is matched through login_emails()
+LOGIN_SCHEMA = Schema(
+    Field('email', required=True, max_length=120),
+    Field('password', required=True, max_length=128, strip=False),
+)
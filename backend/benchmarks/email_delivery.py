@@ -0,0 +1,147 @@
+"""Benchmark draining the email outbox through a slow SMTP relay.
+
+Starts the fake SMTP server with --smtp-delay seconds per message, queues
+--emails outbox rows, and times EmailWorker.drain() with each sender:
+
+- threads: EMAIL_WORKER_THREADS sender threads sharing the SMTP pool (the default)
+- async:   up to EMAIL_ASYNC_CONCURRENCY aiosmtplib sessions on one event loop
+           (skipped when aiosmtplib is not installed)
+
+Reports wall time, emails per second and the peak number of threads in the
+process as JSON. Quote submissions never wait on SMTP (they only write the
+outbox row); run `python -m benchmarks.load_test --smtp-delay 0.5` to see
+that request latency does not move with the relay's.
+
+Run from the backend directory:
+
+    python -m benchmarks.email_delivery --emails 1000 --smtp-delay 0.5
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--emails', type=int, default=1000, help='emails to queue per sender')
+    parser.add_argument('--smtp-delay', type=float, default=0.5, help='seconds the fake relay takes per message')
+    parser.add_argument('--threads', type=int, default=8, help='EMAIL_WORKER_THREADS (and SMTP pool size) for threads')
+    parser.add_argument('--concurrency', type=int, default=200, help='EMAIL_ASYNC_CONCURRENCY for async')
+    parser.add_argument('--batch-size', type=int, default=500, help='EMAIL_WORKER_BATCH_SIZE for both senders')
+    parser.add_argument('--senders', default='threads,async', help='comma-separated senders to run')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    return parser.parse_args(argv)
+
+
+def app_threads():
+    # The fake SMTP server runs in this process too; leave its handler threads out
+    return sum(1 for thread in threading.enumerate() if 'process_request' not in thread.name)
+
+
+class ThreadSampler:
+    """Records the highest number of app threads seen while running"""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = app_threads()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, app_threads())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    senders = [name.strip() for name in args.senders.split(',') if name.strip()]
+
+    from benchmarks.fake_smtp import FakeSMTPServer
+    from benchmarks.load_test import configure_environment
+    smtp = FakeSMTPServer(delay=args.smtp_delay).start()
+    # The benchmark's load_test settings, plus the per-sender sizes read at import
+    configure_environment(SimpleNamespace(database_url=None, no_cache=True), smtp.port)
+    import os
+    os.environ['SMTP_POOL_SIZE'] = str(args.threads)
+
+    from app import create_app
+    from app.extensions import db
+    from app.models import OutboundEmail
+    from app.services.async_email_service import aiosmtplib
+    from app.services.email_queue import EmailQueue, EmailWorker
+    from app.services.email_service import EmailService
+
+    app = create_app()
+    app.config.update(EMAIL_WORKER_THREADS=args.threads, EMAIL_ASYNC_CONCURRENCY=args.concurrency,
+                      EMAIL_WORKER_BATCH_SIZE=args.batch_size)
+    with app.app_context():
+        db.create_all()
+
+    results = {}
+    try:
+        for sender in senders:
+            if sender == 'async' and aiosmtplib is None:
+                print('Skipping async: aiosmtplib is not installed', file=sys.stderr)
+                results[sender] = None
+                continue
+
+            with app.app_context():
+                OutboundEmail.query.delete()
+                for i in range(args.emails):
+                    EmailQueue.enqueue(f'Benchmark {i}', 'Benchmark body', 'admin@localhost')
+                db.session.commit()
+
+            app.config['EMAIL_SENDER'] = sender
+            worker = EmailWorker(app)
+            sent_before = smtp.counters['messages']
+            print(f'Draining {args.emails} emails with {sender}...', file=sys.stderr)
+            with ThreadSampler() as sampler:
+                started = time.perf_counter()
+                worker.drain(timeout=3600)
+                seconds = time.perf_counter() - started
+            worker.stop()
+            EmailService.close_pool()
+
+            with app.app_context():
+                unsent = OutboundEmail.query.filter(OutboundEmail.status != 'sent').count()
+            results[sender] = {
+                'seconds': round(seconds, 2),
+                'emails_per_sec': round(args.emails / seconds, 1),
+                'peak_threads': sampler.peak,
+                'delivered': smtp.counters['messages'] - sent_before,
+                'unsent': unsent
+            }
+            print(f"{sender:<8} {results[sender]['seconds']:>8}s  {results[sender]['emails_per_sec']:>8} emails/s  "
+                  f"peak threads {sampler.peak}", file=sys.stderr)
+    finally:
+        smtp.stop()
+
+    report = {
+        'emails': args.emails,
+        'smtp_delay': args.smtp_delay,
+        'threads': args.threads,
+        'concurrency': args.concurrency,
+        'batch_size': args.batch_size,
+        'results': results
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Minimal in-memory SMTP server for benchmarks.
+
+Speaks just enough SMTP (EHLO/HELO, AUTH, MAIL, RCPT, DATA, NOOP, RSET,
+QUIT) for smtplib, without STARTTLS, so run the app with EMAIL_SECURE=true
+against it. An optional per-message delay simulates a slow relay.
+"""
+import socketserver
+import threading
+import time
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+        self.wfile.flush()
+
+    def handle(self):
+        server = self.server
+        server.record('connections')
+        self.reply('220 fake-smtp ready')
+
+        in_data = False
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+
+            if in_data:
+                if line.rstrip(b'\r\n') == b'.':
+                    in_data = False
+                    if server.delay:
+                        time.sleep(server.delay)
+                    server.record('messages')
+                    self.reply('250 OK: queued')
+                continue
+
+            command = line.decode(errors='replace').strip().upper()
+            if command.startswith('EHLO'):
+                self.reply('250-fake-smtp')
+                self.reply('250 AUTH PLAIN LOGIN')
+            elif command.startswith('HELO'):
+                self.reply('250 fake-smtp')
+            elif command.startswith('AUTH'):
+                self.reply('235 Authentication successful')
+            elif command.startswith('DATA'):
+                in_data = True
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+            elif command.startswith('QUIT'):
+                self.reply('221 Bye')
+                return
+            else:
+                # MAIL, RCPT, NOOP, RSET
+                self.reply('250 OK')
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    request_queue_size = 1024  # accept bursts of concurrent connections
+
+    def __init__(self, host='127.0.0.1', port=0, delay=0.0):
+        super().__init__((host, port), _SMTPHandler)
+        self.delay = delay
+        self.counters = {'connections': 0, 'messages': 0}
+        self._counter_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def record(self, counter):
+        with self._counter_lock:
+            self.counters[counter] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-smtp', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,371 @@
+"""Load-test the API end to end.
+
+Starts `create_app()` on a threaded local HTTP server against a temporary
+SQLite database and a fake SMTP server, seeds it, then drives the real
+endpoints with concurrent keep-alive clients and reports latency
+percentiles and throughput per endpoint as JSON.
+
+Run from the backend directory:
+
+    python -m benchmarks.load_test --concurrency 8 --duration 10 --output results.json
+
+Use --database-url to benchmark against another database (it is seeded, so
+point it at a scratch database).
+"""
+import argparse
+import http.client
+import json
+import logging
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+SEED_PASSWORD = 'benchmark-password'
+ENDPOINTS = ['auth_login', 'reviews_list', 'reviews_stats', 'quotes_list', 'quotes_create']
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=200, help='users to seed')
+    parser.add_argument('--reviews', type=int, default=5000, help='reviews to seed')
+    parser.add_argument('--quotes', type=int, default=5000, help='quotes to seed')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent clients per endpoint')
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds to drive each endpoint')
+    parser.add_argument('--warmup', type=float, default=1.0, help='unmeasured seconds before each endpoint run')
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS),
+                        help=f'comma separated subset of: {", ".join(ENDPOINTS)}')
+    parser.add_argument('--smtp-delay', type=float, default=0.0, help='seconds the fake SMTP server waits per message')
+    parser.add_argument('--database-url', help='database to seed and use instead of a temporary SQLite file')
+    parser.add_argument('--no-cache', action='store_true', help='disable the response cache')
+    parser.add_argument('--no-email-worker', action='store_true', help='do not drain the outbox during the run')
+    parser.add_argument('--seed', type=int, default=1234, help='random seed for generated data')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    return parser.parse_args(argv)
+
+
+def configure_environment(args, smtp_port):
+    """Point the app at the benchmark database and fake SMTP server.
+
+    Must run before `app` is imported, since Config reads the environment at
+    import time.
+    """
+    database_url = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='bench-'), 'bench.db')
+    os.environ.update({
+        'DATABASE_URL': database_url,
+        'EMAIL_HOST': '127.0.0.1',
+        'EMAIL_PORT': str(smtp_port),
+        'EMAIL_SECURE': 'true',  # the fake server does not speak STARTTLS
+        'GMAIL_USERNAME': 'bench@localhost',
+        'GMAIL_APP_PASSWORD': 'bench',
+        'RECIPIENT_EMAIL': 'admin@localhost',
+        'EMAIL_WORKER_IN_PROCESS': 'false',  # started by the harness once the schema exists
+        'EMAIL_WORKER_POLL_INTERVAL': '0.2',
+        'RESPONSE_CACHE_ENABLED': 'false' if args.no_cache else 'true',
+        'RATE_LIMIT_ENABLED': 'false',  # every benchmark client shares one IP
+        'LOG_REQUESTS': 'false',  # keep per-request log lines out of the report output
+        'SECRET_KEY': 'benchmark-secret-key-that-is-long-enough-for-hs256',
+    })
+    return database_url
+
+
+def seed(app, args):
+    from sqlalchemy import insert
+    from werkzeug.security import generate_password_hash
+    from app.extensions import db
+    from app.models import Quote, Review, User
+    from app.services.review_stats_service import ReviewStatsService
+
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    chunk = 1000
+
+    def bulk(model, rows):
+        for start in range(0, len(rows), chunk):
+            db.session.execute(insert(model), rows[start:start + chunk])
+
+    with app.app_context():
+        db.create_all()
+
+        # Hash once: seeding thousands of users should not take minutes
+        password_hash = generate_password_hash(SEED_PASSWORD)
+        bulk(User, [{
+            'username': f'user{i}',
+            'email': f'user{i}@bench.local',
+            'password_hash': password_hash,
+            'is_admin': i == 0,
+            'created_at': now
+        } for i in range(args.users)])
+
+        bulk(Review, [{
+            'title': f'Review {i}',
+            'content': 'Solid work, on time and on budget. ' * rng.randint(1, 5),
+            'rating': rng.randint(1, 5),
+            'user_id': rng.randint(1, args.users),
+            'created_at': now - timedelta(minutes=i),
+            'updated_at': now - timedelta(minutes=i)
+        } for i in range(args.reviews)])
+
+        bulk(Quote, [{
+            'name': f'Client {i}',
+            'email': f'client{i}@example.com',
+            'phone': f'555-{i:07d}',
+            'service_type': rng.choice(['Roofing', 'Remodeling', 'Decks', 'Concrete']),
+            'project_details': 'Replace the back deck and add a covered patio. ' * rng.randint(1, 4),
+            'preferred_contact_method': rng.choice(['email', 'phone']),
+            'budget_range': rng.choice(['<10k', '10k-25k', '25k+']),
+            'timeline': rng.choice(['ASAP', '1-3 months', 'Flexible']),
+            'status': rng.choice(['pending', 'pending', 'contacted', 'closed']),
+            'created_at': now - timedelta(minutes=i),
+            'updated_at': now - timedelta(minutes=i)
+        } for i in range(args.quotes)])
+
+        ReviewStatsService.rebuild()
+        db.session.commit()
+
+
+def start_server(app):
+    from werkzeug.serving import make_server
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, name='bench-http', daemon=True)
+    thread.start()
+    return server
+
+
+class Client:
+    """One keep-alive HTTP connection to the app under test"""
+
+    def __init__(self, port):
+        self.port = port
+        self.connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        try:
+            self.connection.request(method, path, payload, headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            # Reconnect once; the dev server may close idle keep-alive sockets
+            self.connection.close()
+            self.connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+            self.connection.request(method, path, payload, headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        return response.status, data
+
+    def close(self):
+        self.connection.close()
+
+
+def login(client, email):
+    status, data = client.request('POST', '/api/auth/login', {'email': email, 'password': SEED_PASSWORD})
+    if status != 200:
+        raise RuntimeError(f'Login failed for {email}: {status} {data[:200]!r}')
+    return json.loads(data)['data']['access_token']
+
+
+def make_scenarios(args, admin_token):
+    """endpoint name -> function(rng) returning (method, path, body, headers, expected statuses)"""
+    admin_headers = {'Authorization': f'Bearer {admin_token}'}
+
+    def auth_login(rng):
+        email = f'user{rng.randrange(args.users)}@bench.local'
+        return 'POST', '/api/auth/login', {'email': email, 'password': SEED_PASSWORD}, None, (200,)
+
+    def reviews_list(rng):
+        sort = rng.choice(['newest', 'rating'])
+        return 'GET', f'/api/reviews?sort={sort}', None, None, (200,)
+
+    def reviews_stats(rng):
+        return 'GET', '/api/reviews/stats', None, None, (200,)
+
+    def quotes_list(rng):
+        return 'GET', '/api/quotes?limit=50', None, admin_headers, (200,)
+
+    def quotes_create(rng):
+        body = {
+            'name': 'Load Test',
+            'email': f'load{rng.randrange(10 ** 6)}@example.com',
+            'phone': '555-0100',
+            'serviceType': 'Roofing',
+            'projectDetails': 'Benchmark submission',
+            'preferredContactMethod': 'email'
+        }
+        return 'POST', '/api/quotes', body, None, (201,)
+
+    return {
+        'auth_login': auth_login,
+        'reviews_list': reviews_list,
+        'reviews_stats': reviews_stats,
+        'quotes_list': quotes_list,
+        'quotes_create': quotes_create,
+    }
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def run_endpoint(port, scenario, args, seed):
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    start_measuring = threading.Event()
+    stop = threading.Event()
+
+    def worker(worker_id):
+        rng = random.Random(seed * 1000 + worker_id)
+        client = Client(port)
+        local_latencies = []
+        local_errors = []
+        try:
+            while not stop.is_set():
+                method, path, body, headers, expected = scenario(rng)
+                started = time.perf_counter()
+                try:
+                    status, _ = client.request(method, path, body, headers)
+                except Exception as e:
+                    status = f'{e.__class__.__name__}: {e}'
+                elapsed = time.perf_counter() - started
+                if start_measuring.is_set():
+                    if status in expected:
+                        local_latencies.append(elapsed)
+                    else:
+                        local_errors.append(status)
+        finally:
+            client.close()
+            with lock:
+                latencies.extend(local_latencies)
+                errors.extend(local_errors)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(args.warmup)
+    start_measuring.set()
+    measured_from = time.perf_counter()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - measured_from
+
+    latencies.sort()
+    to_ms = lambda value: round(value * 1000, 3) if value is not None else None
+    error_samples = sorted({str(error) for error in errors})[:5]
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'error_samples': error_samples,
+        'requests_per_sec': round(len(latencies) / wall, 2) if wall else None,
+        'latency_ms': {
+            'mean': to_ms(sum(latencies) / len(latencies)) if latencies else None,
+            'p50': to_ms(percentile(latencies, 0.50)),
+            'p95': to_ms(percentile(latencies, 0.95)),
+            'p99': to_ms(percentile(latencies, 0.99)),
+            'max': to_ms(latencies[-1]) if latencies else None
+        }
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    endpoints = [name.strip() for name in args.endpoints.split(',') if name.strip()]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        sys.exit(f'Unknown endpoint(s): {", ".join(sorted(unknown))}')
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+
+    from benchmarks.fake_smtp import FakeSMTPServer
+    smtp = FakeSMTPServer(delay=args.smtp_delay).start()
+    database_url = configure_environment(args, smtp.port)
+
+    from app import create_app
+    app = create_app()
+
+    print('Seeding database...', file=sys.stderr)
+    seed_started = time.perf_counter()
+    seed(app, args)
+    seed_seconds = time.perf_counter() - seed_started
+
+    worker = None
+    if not args.no_email_worker:
+        from app.services.email_queue import EmailWorker
+        worker = EmailWorker(app).start()
+
+    server = start_server(app)
+    port = server.server_port
+    try:
+        setup_client = Client(port)
+        admin_token = login(setup_client, 'user0@bench.local')
+        setup_client.close()
+
+        scenarios = make_scenarios(args, admin_token)
+        results = {}
+        for index, name in enumerate(endpoints):
+            print(f'Running {name} ({args.concurrency} clients, {args.duration}s)...', file=sys.stderr)
+            results[name] = run_endpoint(port, scenarios[name], args, args.seed + index)
+    finally:
+        server.shutdown()
+        if worker is not None:
+            worker.stop(timeout=10)
+        smtp.stop()
+
+    report = {
+        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'database': database_url.split('@')[-1],
+        },
+        'parameters': {
+            'users': args.users,
+            'reviews': args.reviews,
+            'quotes': args.quotes,
+            'concurrency': args.concurrency,
+            'duration': args.duration,
+            'warmup': args.warmup,
+            'smtp_delay': args.smtp_delay,
+            'response_cache': not args.no_cache,
+            'email_worker': not args.no_email_worker,
+        },
+        'seed_seconds': round(seed_seconds, 3),
+        'smtp': dict(smtp.counters),
+        'endpoints': results
+    }
+
+    for name, result in results.items():
+        latency = result['latency_ms']
+        print(f"{name:<15} {result['requests_per_sec']:>9} req/s  p50 {latency['p50']} ms  "
+              f"p95 {latency['p95']} ms  p99 {latency['p99']} ms  errors {result['errors']}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark quote full-text search.
+
+Seeds a temporary SQLite database (or --database-url, which must be a
+scratch database) with --quotes quotes, then times QuoteService.search()
+for a set of queries, first page and second page, and reports the best
+of --repeat runs as JSON.
+
+Run from the backend directory:
+
+    python -m benchmarks.search --quotes 200000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+QUERIES = ['deck', 'roo', 'client 12345', 'client1234@example.com', 'covered patio', 'nomatch']
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quotes', type=int, default=200000, help='quotes to seed')
+    parser.add_argument('--limit', type=int, default=20, help='page size')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per query (the best one is reported)')
+    parser.add_argument('--database-url', help='database to seed and use instead of a temporary SQLite file')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    return parser.parse_args(argv)
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return round(min(timings) * 1000, 2), result
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ['DATABASE_URL'] = args.database_url or (
+        'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='bench-'), 'bench.db'))
+    os.environ['EMAIL_WORKER_IN_PROCESS'] = 'false'
+
+    from app import create_app
+    from app.services.quote_service import QuoteService
+    from benchmarks.load_test import seed
+
+    app = create_app()
+    print(f'Seeding {args.quotes} quotes...', file=sys.stderr)
+    started = time.perf_counter()
+    seed(app, SimpleNamespace(users=10, reviews=0, quotes=args.quotes, seed=1234))
+    seed_seconds = time.perf_counter() - started
+
+    results = {}
+    with app.app_context():
+        for q in QUERIES:
+            first_ms, (rows, cursor) = best_of(args.repeat, lambda: QuoteService.search(q, args.limit))
+            second_ms = None
+            if cursor:
+                second_ms, _ = best_of(args.repeat, lambda: QuoteService.search(q, args.limit, cursor=cursor))
+            results[q] = {'rows': len(rows), 'first_page_ms': first_ms, 'second_page_ms': second_ms}
+            print(f'{q!r:<28} {len(rows):>3} rows  first page {first_ms:>8} ms  second page {second_ms} ms',
+                  file=sys.stderr)
+
+    report = {'quotes': args.quotes, 'limit': args.limit, 'seed_seconds': round(seed_seconds, 1), 'results': results}
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
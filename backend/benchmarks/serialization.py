@@ -0,0 +1,111 @@
+"""Benchmark serializing large quote and review listings.
+
+Seeds a temporary SQLite database, then times fetching and encoding one
+listing of --rows rows three ways:
+
+- orm_stdlib:     ORM objects -> to_dict() -> stdlib JSON provider (the old path)
+- columns_stdlib: column tuples -> row_to_dict() -> stdlib JSON provider
+- columns_orjson: column tuples -> row_to_dict() -> orjson provider (the default
+                  when orjson is installed)
+
+Run from the backend directory:
+
+    python -m benchmarks.serialization --rows 10000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000, help='rows per listing (and rows seeded)')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per variant (the best one is reported)')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    return parser.parse_args(argv)
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(func())
+        timings.append(time.perf_counter() - started)
+    return {'ms': round(min(timings) * 1000, 2), 'bytes': size}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='bench-'), 'bench.db')
+    os.environ['EMAIL_WORKER_IN_PROCESS'] = 'false'
+
+    from flask.json.provider import DefaultJSONProvider
+    from app import create_app
+    from app.extensions import db
+    from app.json_provider import OrjsonProvider, orjson
+    from app.models import Quote, Review, User
+    from benchmarks.load_test import seed
+
+    app = create_app()
+    print(f'Seeding {args.rows} quotes and reviews...', file=sys.stderr)
+    seed(app, SimpleNamespace(users=200, reviews=args.rows, quotes=args.rows, seed=1234))
+
+    providers = {'stdlib': DefaultJSONProvider(app)}
+    if orjson is not None:
+        providers['orjson'] = OrjsonProvider(app)
+
+    def encode(provider, data):
+        return provider.response({'success': True, 'data': data}).get_data()
+
+    listings = {
+        'quotes': {
+            'orm': lambda: [quote.to_dict() for quote in
+                            Quote.query.order_by(Quote.created_at.desc(), Quote.id.desc()).limit(args.rows)],
+            'columns': lambda: [Quote.row_to_dict(row) for row in
+                                db.session.query(*Quote.listing_columns())
+                                .order_by(Quote.created_at.desc(), Quote.id.desc()).limit(args.rows)],
+        },
+        'reviews': {
+            'orm': lambda: [review.to_dict() for review in
+                            Review.query.order_by(Review.created_at.desc(), Review.id.desc()).limit(args.rows)],
+            'columns': lambda: [Review.row_to_dict(row) for row in
+                                db.session.query(*Review.listing_columns())
+                                .outerjoin(User, Review.user_id == User.id)
+                                .order_by(Review.created_at.desc(), Review.id.desc()).limit(args.rows)],
+        },
+    }
+
+    results = {}
+    with app.app_context():
+        for name, fetchers in listings.items():
+            def run(fetch, provider):
+                def listing():
+                    data = fetch()
+                    db.session.expunge_all()  # every run hydrates from scratch
+                    return encode(provider, data)
+                return listing
+
+            results[name] = {
+                'orm_stdlib': best_of(args.repeat, run(fetchers['orm'], providers['stdlib'])),
+                'columns_stdlib': best_of(args.repeat, run(fetchers['columns'], providers['stdlib'])),
+            }
+            if 'orjson' in providers:
+                results[name]['columns_orjson'] = best_of(args.repeat, run(fetchers['columns'], providers['orjson']))
+            for variant, result in results[name].items():
+                print(f"{name:<8} {variant:<15} {result['ms']:>9} ms  {result['bytes']} bytes", file=sys.stderr)
+
+    report = {'rows': args.rows, 'repeat': args.repeat, 'orjson': orjson is not None, 'results': results}
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
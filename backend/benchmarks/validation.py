@@ -0,0 +1,78 @@
+"""Micro-benchmark the request payload schemas.
+
+Times `Schema.load()` on representative valid and invalid quote, review and
+auth payloads, without a database, app or network, and reports the cost
+per call as JSON.
+
+Run from the backend directory:
+
+    python -m benchmarks.validation --number 20000
+"""
+import argparse
+import json
+import sys
+import timeit
+
+from app.utils.validators import (
+    LOGIN_SCHEMA, QUOTE_SCHEMA, REGISTER_SCHEMA, REVIEW_SCHEMA, ValidationError
+)
+
+QUOTE = {
+    'name': 'Jane Doe',
+    'email': 'Jane.Doe@Example.com',
+    'phone': '(555) 123-4567',
+    'serviceType': 'Roofing',
+    'projectDetails': 'Replace the shingles on a two storey house. ' * 10,
+    'preferredContactMethod': 'phone',
+    'budgetRange': '$5,000 - $10,000',
+    'timeline': 'Within 3 months'
+}
+
+CASES = {
+    'quote_valid': (QUOTE_SCHEMA, QUOTE),
+    'quote_missing_fields': (QUOTE_SCHEMA, {'name': 'Jane Doe'}),
+    'quote_bad_email': (QUOTE_SCHEMA, {**QUOTE, 'email': 'not-an-email'}),
+    'quote_too_long': (QUOTE_SCHEMA, {**QUOTE, 'name': 'x' * 500}),
+    'review_valid': (REVIEW_SCHEMA, {'title': 'Great work', 'content': 'On time and tidy. ' * 10, 'rating': 5}),
+    'review_bad_rating': (REVIEW_SCHEMA, {'title': 'Great work', 'content': 'Tidy', 'rating': 9}),
+    'register_valid': (REGISTER_SCHEMA, {'email': 'jane@example.com', 'username': 'jane',
+                                         'password': 'correct horse battery staple'}),
+    'login_valid': (LOGIN_SCHEMA, {'email': 'jane@example.com', 'password': 'correct horse battery staple'}),
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=10000, help='calls per timing run')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per case (the best one is reported)')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    return parser.parse_args(argv)
+
+
+def load(schema, payload):
+    try:
+        schema.load(payload)
+    except ValidationError:
+        pass
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = {}
+    for name, (schema, payload) in CASES.items():
+        runs = timeit.repeat(lambda: load(schema, payload), number=args.number, repeat=args.repeat)
+        microseconds = min(runs) / args.number * 1e6
+        results[name] = {'us_per_call': round(microseconds, 2), 'calls_per_sec': round(1e6 / microseconds)}
+        print(f'{name:<22} {microseconds:>8.2f} us/call', file=sys.stderr)
+
+    report = {'number': args.number, 'repeat': args.repeat, 'results': results}
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
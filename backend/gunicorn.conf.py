@@ -0,0 +1,61 @@
+"""gunicorn settings: gunicorn -c gunicorn.conf.py wsgi:app
+
+Each setting can be overridden from the environment.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', f"0.0.0.0:{os.getenv('PORT', 8000)}")
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Load the app (and warm it up) once in the master; workers share its
+# memory copy-on-write and start serving immediately
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+# On SIGTERM workers stop accepting connections and get this long to finish
+# in-flight requests and drain pending emails
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then to cap slow memory growth
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 200))
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    from app.config import Config
+    if workers > 1 and Config.EVENTS_BACKEND == 'memory':
+        server.log.warning(
+            f"EVENTS_BACKEND=memory with {workers} workers: /api/quotes/stream only sees quotes "
+            "created by the worker serving it. Set EVENTS_BACKEND=redis, or WEB_CONCURRENCY=1."
+        )
+
+
+def when_ready(server):
+    # The master serves no requests; background workers run in the workers
+    if preload_app:
+        from app.server import stop_background
+        from wsgi import app
+        stop_background(app)
+
+
+def post_fork(server, worker):
+    # Without preload each worker imports wsgi itself and starts fresh
+    if not preload_app:
+        return
+    from app.server import after_fork
+    from wsgi import app
+    after_fork(app)
+
+
+def worker_exit(server, worker):
+    from app.server import shutdown
+    from wsgi import app
+    shutdown(app)
@@ -0,0 +1,87 @@
+"""add quote search
+
+Revision ID: 9a7c3e5d1b24
+Revises: 6f2d9b4e8a13
+Create Date: 2026-10-18 15:02:33.904517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a7c3e5d1b24'
+down_revision = '6f2d9b4e8a13'
+branch_labels = None
+depends_on = None
+
+
+# Keep in sync with SQLITE_SEARCH_DDL / POSTGRES_SEARCH_DDL in app/models/quote.py
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS quotes_fts USING fts5(
+        name, email, service_type, project_details,
+        content='quotes', content_rowid='id', tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3 4'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS quotes_fts_insert AFTER INSERT ON quotes BEGIN
+        INSERT INTO quotes_fts(rowid, name, email, service_type, project_details)
+        VALUES (new.id, new.name, new.email, new.service_type, new.project_details);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS quotes_fts_delete AFTER DELETE ON quotes BEGIN
+        INSERT INTO quotes_fts(quotes_fts, rowid, name, email, service_type, project_details)
+        VALUES ('delete', old.id, old.name, old.email, old.service_type, old.project_details);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS quotes_fts_update
+    AFTER UPDATE OF name, email, service_type, project_details ON quotes BEGIN
+        INSERT INTO quotes_fts(quotes_fts, rowid, name, email, service_type, project_details)
+        VALUES ('delete', old.id, old.name, old.email, old.service_type, old.project_details);
+        INSERT INTO quotes_fts(rowid, name, email, service_type, project_details)
+        VALUES (new.id, new.name, new.email, new.service_type, new.project_details);
+    END
+    """,
+    # Index the quotes that already exist
+    "INSERT INTO quotes_fts(quotes_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS quotes_fts_update",
+    "DROP TRIGGER IF EXISTS quotes_fts_delete",
+    "DROP TRIGGER IF EXISTS quotes_fts_insert",
+    "DROP TABLE IF EXISTS quotes_fts",
+]
+
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE quotes ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(email, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(service_type, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(project_details, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_quotes_search_vector ON quotes USING gin (search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_quotes_search_vector",
+    "ALTER TABLE quotes DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run(statements_by_dialect):
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade():
+    _run({'sqlite': SQLITE_UPGRADE, 'postgresql': POSTGRES_UPGRADE})
+
+
+def downgrade():
+    _run({'sqlite': SQLITE_DOWNGRADE, 'postgresql': POSTGRES_DOWNGRADE})
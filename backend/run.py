@@ -1,7 +1,8 @@
 from app import create_app
 
+# Development server only. In production serve wsgi:app with gunicorn:
+#   gunicorn -c gunicorn.conf.py wsgi:app
 app = create_app()
 
 if __name__ == '__main__':
-    app = create_app()
     app.run(host='0.0.0.0', port=8000, debug=True)
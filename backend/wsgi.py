@@ -0,0 +1,30 @@
+"""Production entry point.
+
+    gunicorn -c gunicorn.conf.py wsgi:app     (Linux/macOS)
+    python wsgi.py                            (waitress, e.g. on Windows)
+
+The app is created and warmed up once at import, so with gunicorn's
+preload_app every worker forks from a process that already holds the
+compiled routes, validators and SQL statements.
+"""
+import atexit
+import os
+from app import create_app
+from app.server import warm_up, shutdown
+
+app = create_app()
+warm_up(app)
+
+
+if __name__ == '__main__':
+    try:
+        from waitress import serve
+    except ImportError:
+        raise SystemExit('waitress is not installed: pip install waitress, or use gunicorn -c gunicorn.conf.py wsgi:app')
+
+    # waitress finishes in-flight requests on Ctrl+C/SIGTERM, then exits
+    atexit.register(shutdown, app)
+    serve(app,
+          host=os.getenv('HOST', '0.0.0.0'),
+          port=int(os.getenv('PORT', 8000)),
+          threads=int(os.getenv('WAITRESS_THREADS', 8)))
@@ -2,8 +2,15 @@
 import { Formik, Form, Field, ErrorMessage } from 'formik';
 import * as Yup from 'yup';
 import axios from 'axios';
+import { useRef } from 'react';
+
+const newIdempotencyKey = () =>
+  window.crypto?.randomUUID?.() ?? `${Date.now()}-${Math.random().toString(36).slice(2)}`;
 
 const QuoteForm = () => {
+  // One key per quote: double submits and retries are answered with the original quote
+  const idempotencyKey = useRef(newIdempotencyKey());
+
   const initialValues = {
     name: '',
     email: '',
@@ -26,8 +33,11 @@ const QuoteForm = () => {
 
   const handleSubmit = async (values, { setSubmitting, resetForm }) => {
     try {
-      const response = await axios.post('http://localhost:5000/api/quotes', values);
+      const response = await axios.post('http://localhost:5000/api/quotes', values, {
+        headers: { 'Idempotency-Key': idempotencyKey.current }
+      });
       console.log('Quote submitted:', response.data);
+      idempotencyKey.current = newIdempotencyKey();
       resetForm();
       alert('Quote request submitted successfully!');
     } catch (error) {
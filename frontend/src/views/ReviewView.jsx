@@ -4,6 +4,8 @@ import ReviewForm from '../components/forms/ReviewForm';
 import { Star, Clock, ThumbsUp, MessageSquare, Shield, Filter, SortAsc } from 'lucide-react';
 import api from '../services/api';
 
+const REVIEWS_PAGE_SIZE = 20;
+
 const ReviewView = () => {
   const [reviews, setReviews] = useState([]);
   const [isLoading, setIsLoading] = useState(true);
@@ -11,19 +13,50 @@ const ReviewView = () => {
   const [isAuthenticated, setIsAuthenticated] = useState(false);
   const [filterRating, setFilterRating] = useState(0);
   const [sortBy, setSortBy] = useState('newest');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [stats, setStats] = useState(null);
+
+  // The API pages by newest or highest rated; the other orders are applied to the loaded reviews
+  const serverSort = sortBy === 'highest' ? 'rating' : 'newest';
 
   useEffect(() => {
     const token = localStorage.getItem('token');
     setIsAuthenticated(!!token);
-    fetchReviews();
+    fetchStats();
   }, []);
 
+  useEffect(() => {
+    fetchReviews();
+  }, [serverSort]);
+
+  const fetchStats = async () => {
+    try {
+      const response = await api.get('/api/reviews/stats');
+      setStats(response.data.data || null);
+    } catch (error) {
+      // The summary is optional; the reviews list reports its own errors
+      console.error('Error fetching review stats:', error);
+      setStats(null);
+    }
+  };
+
+  const handleReviewSubmitted = () => {
+    fetchReviews();
+    fetchStats();
+  };
+
+  const fetchPage = (cursor) => api.get('/api/reviews', {
+    params: { limit: REVIEWS_PAGE_SIZE, sort: serverSort, ...(cursor && { cursor }) }
+  });
+
   const fetchReviews = async () => {
     setIsLoading(true);
     setError(null);
     try {
-      const response = await api.get('/api/reviews');
+      const response = await fetchPage(null);
       setReviews(response.data.data || []);
+      setNextCursor(response.data.pagination?.next_cursor || null);
     } catch (error) {
       if (api.isAuthError(error)) {
         setError('Please log in to view reviews.');
@@ -36,16 +69,34 @@ const ReviewView = () => {
       }
       console.error('Error fetching reviews:', error);
       setReviews([]);
+      setNextCursor(null);
     } finally {
       setIsLoading(false);
     }
   };
 
+  const loadMoreReviews = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    setError(null);
+    try {
+      const response = await fetchPage(nextCursor);
+      setReviews(current => [...current, ...(response.data.data || [])]);
+      setNextCursor(response.data.pagination?.next_cursor || null);
+    } catch (error) {
+      setError('Error loading more reviews. Please try again later.');
+      console.error('Error fetching more reviews:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const Stats = () => {
-    if (!reviews.length) return null;
+    if (!stats || !stats.count) return null;
 
-    const averageRating = reviews.reduce((acc, review) => acc + review.rating, 0) / reviews.length;
-    const satisfactionRate = Math.round((reviews.filter(r => r.rating >= 4).length / reviews.length) * 100);
+    const distribution = stats.distribution || {};
+    const averageRating = stats.average_rating || 0;
+    const satisfactionRate = Math.round((((distribution['4'] || 0) + (distribution['5'] || 0)) / stats.count) * 100);
 
     return (
       <div className="grid grid-cols-1 md:grid-cols-3 gap-6 mb-12">
@@ -67,7 +118,7 @@ const ReviewView = () => {
             </div>
             <div>
               <p className="text-sm text-gray-600">Total Reviews</p>
-              <p className="text-2xl font-bold text-gray-900">{reviews.length}</p>
+              <p className="text-2xl font-bold text-gray-900">{stats.count}</p>
             </div>
           </div>
         </div>
@@ -171,7 +222,7 @@ const ReviewView = () => {
             </div>
 
             {isAuthenticated ? (
-              <ReviewForm onReviewSubmitted={fetchReviews} />
+              <ReviewForm onReviewSubmitted={handleReviewSubmitted} />
             ) : (
               <div className="flex flex-col sm:flex-row justify-center gap-4">
                 <Link
@@ -281,6 +332,19 @@ const ReviewView = () => {
                 </div>
               )}
             </div>
+
+            {nextCursor && (
+              <div className="flex justify-center mt-8">
+                <button
+                  type="button"
+                  onClick={loadMoreReviews}
+                  disabled={isLoadingMore}
+                  className="inline-flex items-center justify-center px-6 py-3 rounded-xl bg-blue-50 text-blue-600 hover:bg-blue-100 transition-all duration-200 disabled:opacity-50"
+                >
+                  {isLoadingMore ? 'Loading...' : 'Load More Reviews'}
+                </button>
+              </div>
+            )}
           </>
         )}
       </div>